@@ -0,0 +1,12 @@
+import importlib
+import os
+import sys
+
+# The package directory has a hyphen in it, so tests import its modules with
+# importlib.import_module("uav-png.<module>") from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+
+def load(module):
+    return importlib.import_module(f"uav-png.{module}")
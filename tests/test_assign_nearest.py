@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from conftest import load
+
+Swarm = load("Swarm")
+
+
+def greedy_reference(points, candidates):
+    """Match every pair, closest first: the result assign_nearest must give."""
+    distances = np.linalg.norm(points[:, None, :] - candidates[None, :, :], axis=2)
+    order = np.argsort(distances, axis=None, kind="stable")
+    point_taken = np.zeros(len(points), dtype=bool)
+    candidate_taken = np.zeros(len(candidates), dtype=bool)
+    pairs = set()
+    for point, candidate in zip(*np.unravel_index(order, distances.shape)):
+        if not point_taken[point] and not candidate_taken[candidate]:
+            point_taken[point] = candidate_taken[candidate] = True
+            pairs.add((int(point), int(candidate)))
+    return pairs
+
+
+def layouts(seed):
+    rng = np.random.default_rng(seed)
+    spread = rng.uniform(0, 1000, (400, 2))
+    # Points bunched in a corner lose their nearest candidates to each
+    # other and have to query again for more
+    bunched = rng.normal(50, 5, (300, 2))
+    yield spread[:300], rng.uniform(0, 1000, (400, 2))
+    yield bunched, spread
+    yield spread, bunched
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_matches_brute_force_past_the_pair_limit(seed):
+    for points, candidates in layouts(seed):
+        assert len(points) * len(candidates) > Swarm.BRUTE_FORCE_PAIRS
+        served, chosen = Swarm.assign_nearest(points, candidates)
+        assert len(served) == min(len(points), len(candidates))
+        assert set(zip(served.tolist(), chosen.tolist())) == greedy_reference(
+            points, candidates
+        )
+
+
+def test_small_sets_match_with_the_tree_forced(monkeypatch):
+    monkeypatch.setattr(Swarm, "BRUTE_FORCE_PAIRS", 0)
+    rng = np.random.default_rng(7)
+    for size in (1, 2, 9, 17, 40):
+        points = rng.uniform(0, 100, (size, 2))
+        candidates = rng.uniform(0, 100, (size + 5, 2))
+        served, chosen = Swarm.assign_nearest(points, candidates)
+        assert set(zip(served.tolist(), chosen.tolist())) == greedy_reference(
+            points, candidates
+        )
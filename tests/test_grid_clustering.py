@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from sklearn.cluster import DBSCAN
+
+from conftest import load
+
+GridClustering = load("GridClustering").GridClustering
+TileGrid = load("engine.TileGrid").TileGrid
+
+
+def assert_matches_dbscan(clustering, mask):
+    """Same partition of the remaining cells as DBSCAN(eps=1, min_samples=1)."""
+    clustering.flush()
+    xs, ys = np.nonzero(mask)
+    labels = np.asarray(clustering.labels[xs, ys])
+    assert (labels >= 0).all()
+    assert set(labels.tolist()) == set(clustering.components)
+    for label in clustering.components:
+        cx, cy = clustering.cells(label)
+        assert clustering.counts[label] == len(cx)
+        assert list(clustering.sums[label]) == [cx.sum(), cy.sum()]
+    if not len(xs):
+        return
+    expected = DBSCAN(eps=1, min_samples=1).fit(np.column_stack((xs, ys))).labels_
+    pairs = set(zip(labels.tolist(), expected.tolist()))
+    assert len(pairs) == len(set(labels.tolist())) == len(set(expected.tolist()))
+
+
+@pytest.mark.parametrize("tiled", [False, True])
+@pytest.mark.parametrize("seed", range(8))
+def test_remove_matches_dbscan(tiled, seed):
+    rng = np.random.default_rng(seed)
+    width, height = rng.integers(5, 60, 2)
+    mask = rng.random((width, height)) < rng.uniform(0.4, 0.9)
+    if tiled:
+        grid = TileGrid(mask.shape, bool, False, 8)
+        grid[:, :] = mask
+        clustering = GridClustering(grid)
+    else:
+        clustering = GridClustering(mask.copy())
+    assert_matches_dbscan(clustering, mask)
+
+    for step in range(20):
+        xs, ys = np.nonzero(mask)
+        if not len(xs):
+            break
+        pick = rng.choice(len(xs), min(rng.integers(1, 30), len(xs)), replace=False)
+        if step % 3 == 0:
+            # A whole column at once, to cut components in two
+            pick = np.union1d(pick, np.flatnonzero(xs == rng.integers(0, width)))
+        mask[xs[pick], ys[pick]] = False
+        clustering.remove(xs[pick], ys[pick])
+        if step % 2:
+            assert_matches_dbscan(clustering, mask)
+    assert_matches_dbscan(clustering, mask)
+
+
+@pytest.mark.parametrize("tiled", [False, True])
+def test_split_check_work_does_not_grow_with_component(tiled, monkeypatch):
+    """The same cuts flood the same cells however large the component is."""
+    flooded = []
+    neighbours = GridClustering._neighbours
+
+    def counting(self, xs, ys, label):
+        result = neighbours(self, xs, ys, label)
+        flooded[-1] += len(result[0])
+        return result
+
+    monkeypatch.setattr(GridClustering, "_neighbours", counting)
+    cuts = [
+        # A short wall, a block, and a ring that cuts off a single cell
+        ([0, 0, 0, 0], [0, 1, 2, 3]),
+        ([5, 5, 6, 6], [5, 6, 5, 6]),
+        ([9, 11, 10, 10], [-3, -3, -4, -2]),
+    ]
+    for size in (64, 1024):
+        if tiled:
+            mask = TileGrid((size, size), bool, False, 32)
+            mask[:, :] = True
+        else:
+            mask = np.ones((size, size), dtype=bool)
+        clustering = GridClustering(mask)
+        flooded.append(0)
+        center = size // 2
+        for xs, ys in cuts:
+            clustering.remove(np.add(xs, center), np.add(ys, center))
+            clustering.flush()
+        assert len(clustering.components) == 2
+    assert flooded[0] == flooded[1] < 200
@@ -0,0 +1,96 @@
+import operator
+
+import numpy as np
+import pytest
+
+from conftest import load
+
+TileGrid = load("engine.TileGrid").TileGrid
+
+
+def pair(shape=(37, 23), fill=0, tile_size=8, seed=0):
+    """A TileGrid and a numpy array holding the same random writes."""
+    rng = np.random.default_rng(seed)
+    dense = np.full(shape, fill, dtype=np.int32)
+    grid = TileGrid(shape, np.int32, fill, tile_size)
+    xs = rng.integers(0, shape[0], 200)
+    ys = rng.integers(0, shape[1], 200)
+    values = rng.integers(-3, 4, 200)
+    dense[xs, ys] = values
+    grid[xs, ys] = values
+    return grid, dense
+
+
+@pytest.mark.parametrize("fill", [0, -1])
+def test_fancy_indexing_matches_numpy(fill):
+    grid, dense = pair(fill=fill)
+    rng = np.random.default_rng(1)
+    xs = rng.integers(-dense.shape[0], dense.shape[0], (5, 7))
+    ys = rng.integers(-dense.shape[1], dense.shape[1], (5, 7))
+    np.testing.assert_array_equal(grid[xs, ys], dense[xs, ys])
+    # Scalars broadcast against arrays, and repeated writes keep the last one
+    np.testing.assert_array_equal(grid[3, ys[0]], dense[3, ys[0]])
+    grid[[1, 1, 2], [4, 4, 5]] = [7, 8, 9]
+    dense[[1, 1, 2], [4, 4, 5]] = [7, 8, 9]
+    np.testing.assert_array_equal(np.asarray(grid), dense)
+    assert grid[2, 5] == dense[2, 5]
+
+
+def test_out_of_bounds_raises():
+    grid, _ = pair()
+    with pytest.raises(IndexError):
+        grid[[37], [0]]
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        (slice(None), slice(None)),
+        (slice(3, 30), slice(5, 17)),
+        (slice(8, 16), slice(0, 8)),
+        (slice(30, 100), slice(-5, None)),
+        (slice(10, 5), slice(None)),
+    ],
+)
+def test_slices_match_numpy(key):
+    grid, dense = pair()
+    np.testing.assert_array_equal(grid[key], dense[key])
+
+    grid[key] = 5
+    dense[key] = 5
+    np.testing.assert_array_equal(np.asarray(grid), dense)
+    grid[key] = grid.fill
+    dense[key] = grid.fill
+    np.testing.assert_array_equal(np.asarray(grid), dense)
+
+
+def test_slice_write_of_array():
+    grid, dense = pair()
+    block = np.arange(12 * 9).reshape(12, 9)
+    grid[4:16, 2:11] = block
+    dense[4:16, 2:11] = block
+    np.testing.assert_array_equal(np.asarray(grid), dense)
+
+
+@pytest.mark.parametrize(
+    "compare",
+    [operator.eq, operator.ne, operator.lt, operator.le, operator.gt, operator.ge],
+)
+@pytest.mark.parametrize("fill", [0, -1])
+def test_comparisons_match_numpy(compare, fill):
+    grid, dense = pair(fill=fill)
+    result = compare(grid, 0)
+    assert isinstance(result, TileGrid)
+    np.testing.assert_array_equal(np.asarray(result), compare(dense, 0))
+    np.testing.assert_array_equal(np.asarray(~result), ~compare(dense, 0))
+
+
+@pytest.mark.parametrize("fill", [0, 2])
+def test_reductions_match_numpy(fill):
+    grid, dense = pair(fill=fill)
+    for xs, expected in zip(grid.nonzero(), dense.nonzero()):
+        np.testing.assert_array_equal(xs, expected)
+    assert grid.sum() == dense.sum()
+    assert grid.any() == dense.any()
+    empty = TileGrid(dense.shape, np.int32, 0, 8)
+    assert not empty.any() and empty.sum() == 0
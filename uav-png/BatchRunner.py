@@ -0,0 +1,189 @@
+import copy
+import csv
+import itertools
+import json
+import os
+from concurrent import futures
+import numpy as np
+
+# Sweep parameters understood by make_scenario
+SWEEP_PARAMETERS = (
+    "fleet_size",
+    "connection_range",
+    "wind_direction",
+    "wind_strength",
+    "cluster_method",
+    "n_clusters",
+    "seed",
+)
+
+# The sweep parameters that are map settings of the scenario
+MAP_PARAMETERS = ("wind_direction", "wind_strength", "cluster_method", "n_clusters")
+
+RESULT_COLUMNS = (
+    "ticks",
+    "completed",
+    "coverage_time",
+    "distance_flown",
+    "clustering_calls",
+    "clustering_runs",
+    "wall_time",
+)
+
+
+def init_worker():
+    """
+    Cluster on a thread inside each batch worker: the worker already keeps
+    a core busy, and forking a clustering process from a worker that has
+    started OpenMP threads (KMeans) can deadlock the child.
+    """
+    from .GroundMap import set_shared_cluster_executor
+
+    set_shared_cluster_executor(futures.ThreadPoolExecutor(max_workers=1))
+
+
+def run_mission(config, base_dir, params, max_ticks):
+    """Process pool entry point: fly one headless mission and report metrics."""
+    from .DemoState import DemoState
+    from .HeadlessRunner import HeadlessRunner
+    from .Scenario import Scenario
+
+    scenario = BatchRunner.make_scenario(Scenario(config, base_dir), params)
+    runner = HeadlessRunner(
+        state_factory=lambda: DemoState(scenario=scenario), max_ticks=max_ticks
+    )
+    result = runner.run()
+    row = dict(params)
+    row.update({column: result[column] for column in RESULT_COLUMNS})
+    return row
+
+
+class BatchRunner:
+    """
+    Fly many headless missions in parallel, one per combination of a sweep
+    spec, and collect their metrics into one table.
+
+    A sweep spec maps parameter names to lists of values, e.g.
+
+        {"fleet_size": [3, 10, 30], "cluster_method": ["dbscan", "kmeans"]}
+
+    Every combination of the lists is run; see SWEEP_PARAMETERS for the
+    names. Scalars are treated as one-value lists.
+    """
+
+    def __init__(
+        self,
+        spec: dict,
+        scenario=None,
+        workers: int = None,
+        max_ticks: int = 100_000,
+    ):
+        """
+        Args:
+            spec (dict): Sweep spec, parameter name -> list of values.
+            scenario (Scenario): Base mission (defaults to the bundled demo).
+            workers (int): Worker processes (defaults to every core).
+            max_ticks (int): Give up on a mission after this many ticks.
+        """
+        unknown = set(spec) - set(SWEEP_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+        if scenario is None:
+            from .config import SCENARIO_DIR
+            from .Scenario import Scenario
+
+            scenario = Scenario.load(os.path.join(SCENARIO_DIR, "demo.json"))
+
+        self.spec = spec
+        self.scenario = scenario
+        self.workers = workers or os.cpu_count()
+        self.max_ticks = max_ticks
+
+    def combinations(self):
+        """Every parameter combination of the spec, as dicts."""
+        names = list(self.spec)
+        values = [
+            value if isinstance(value, list) else [value]
+            for value in self.spec.values()
+        ]
+        return [dict(zip(names, combo)) for combo in itertools.product(*values)]
+
+    @staticmethod
+    def make_scenario(base, params):
+        """Copy of the base scenario with the sweep parameters applied."""
+        from .Scenario import Scenario
+
+        config = copy.deepcopy(base.config)
+        settings = config.setdefault("map", {})
+        for name in MAP_PARAMETERS:
+            if name in params:
+                settings[name] = params[name]
+
+        rows = [dict(row) for row in base.fleet_rows()]
+        fleet_size = params.get("fleet_size")
+        if fleet_size is not None and rows:
+            # Extra UAVs repeat the base fleet, scattered around its positions
+            rng = np.random.default_rng(params.get("seed", 0))
+            extra = []
+            for index in range(max(fleet_size - len(rows), 0)):
+                row = dict(rows[index % len(rows)])
+                offset = rng.normal(0.0, 50.0, 2)
+                row["x"] = float(row["x"]) + offset[0]
+                row["y"] = float(row["y"]) + offset[1]
+                extra.append(row)
+            rows = (rows + extra)[:fleet_size]
+        if "connection_range" in params:
+            for row in rows:
+                row["connection_range"] = params["connection_range"]
+        config["fleet"] = rows
+        return Scenario(config, base.base_dir)
+
+    def run(self):
+        """
+        Run every combination and return one result row per mission, in the
+        order of combinations().
+        """
+        combinations = self.combinations()
+        with futures.ProcessPoolExecutor(
+            max_workers=self.workers, initializer=init_worker
+        ) as executor:
+            jobs = [
+                executor.submit(
+                    run_mission,
+                    self.scenario.config,
+                    self.scenario.base_dir,
+                    params,
+                    self.max_ticks,
+                )
+                for params in combinations
+            ]
+            results = []
+            for params, job in zip(combinations, jobs):
+                try:
+                    results.append(job.result())
+                except Exception as e:
+                    print(f"Error running mission {params}: {e}")
+                    results.append(dict(params, error=str(e)))
+        return results
+
+    @staticmethod
+    def save(results, path):
+        """Write the results table as CSV."""
+        columns = []
+        for row in results:
+            columns.extend(name for name in row if name not in columns)
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+            for row in results:
+                writer.writerow(
+                    {
+                        name: json.dumps(value) if isinstance(value, list) else value
+                        for name, value in row.items()
+                    }
+                )
+
+    @staticmethod
+    def load_spec(path):
+        with open(path) as file:
+            return json.load(file)
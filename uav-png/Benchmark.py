@@ -0,0 +1,309 @@
+import json
+import platform
+import statistics
+import time
+import numpy as np
+
+QUICK_SWEEP = {
+    "map_sizes": [(30, 20), (200, 200)],
+    "fleet_sizes": [5, 100, 1000],
+    "densities": [0.05, 0.3],
+}
+
+FULL_SWEEP = {
+    "map_sizes": [(30, 20), (200, 200), (1000, 1000), (2000, 2000)],
+    "fleet_sizes": [5, 100, 1000, 10_000],
+    "densities": [0.05, 0.3],
+}
+
+# Scan batches per GroundMap.scan+update_cluster case
+SCAN_STEPS = 20
+
+
+class Benchmark:
+    """Scaling benchmarks for map size, fleet size and AoI density."""
+
+    def __init__(
+        self,
+        sweep=None,
+        repeats: int = 3,
+        max_cluster_points: int = 200_000,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            sweep (dict): map_sizes, fleet_sizes and densities to cover.
+            repeats (int): Timed runs per case; the median is reported.
+            max_cluster_points (int): Skip sklearn cases above this many AoI cells.
+            seed (int): Seed for the random AoI and fleet layouts.
+        """
+        self.sweep = sweep or QUICK_SWEEP
+        self.repeats = repeats
+        self.max_cluster_points = max_cluster_points
+        self.seed = seed
+        self.results = []
+
+    def _time(self, name, params, setup, run):
+        """Median seconds of run(setup()) over repeats, each on a fresh setup."""
+        timings = []
+        for _ in range(self.repeats):
+            fixture = setup()
+            start = time.perf_counter()
+            run(fixture)
+            timings.append(time.perf_counter() - start)
+        result = {
+            "name": name,
+            "params": params,
+            "seconds": statistics.median(timings),
+            "min_seconds": min(timings),
+        }
+        self.results.append(result)
+        milliseconds = result["seconds"] * 1000
+        print(f"{name:<30} {json.dumps(params):<56} {milliseconds:10.3f} ms")
+        return result
+
+    def _make_map(self, width, height, density):
+        from .GroundMap import GroundMap
+
+        rng = np.random.default_rng(self.seed)
+        xs, ys = np.nonzero(rng.random((width, height)) < density)
+        return GroundMap(
+            AoI=np.column_stack((xs, ys)),
+            width=width,
+            height=height,
+            wind_direction=[0.5, 0.5],
+            wind_strength=10,
+        )
+
+    def _make_fleet(self, ground_map, count):
+        from .Uav import Uav
+
+        rng = np.random.default_rng(self.seed + 1)
+        extent = (
+            ground_map.width * ground_map.cell_size,
+            ground_map.height * ground_map.cell_size,
+        )
+        positions = rng.uniform((0, 0), extent, (count, 2))
+        return [
+            Uav(
+                remain_energy=100,
+                min_speed=1,
+                max_speed=10,
+                buffer_data=50,
+                pos=position,
+                size=30,
+                connection_range=100,
+            )
+            for position in positions
+        ]
+
+    def bench_scan(self, width, height, density, fleet_size):
+        """One batched scan under the whole fleet, as SwarmManager does it."""
+
+        def setup():
+            ground_map = self._make_map(width, height, density)
+            uavs = self._make_fleet(ground_map, fleet_size)
+            return ground_map, np.array([uav.pos for uav in uavs])
+
+        def run(fixture):
+            ground_map, positions = fixture
+            ground_map.scan(positions)
+
+        params = {"map": [width, height], "density": density, "uavs": fleet_size}
+        self._time("GroundMap.scan", params, setup, run)
+
+    def bench_assign_targets(self, width, height, density, fleet_size):
+        """Joint target assignment with every UAV in a swarm of its own."""
+        from .SwarmManager import SwarmManager
+
+        def setup():
+            ground_map = self._make_map(width, height, density)
+            manager = SwarmManager()
+            for uav in self._make_fleet(ground_map, fleet_size):
+                manager.add_uav(uav)
+            # Clustering is timed on its own; this one is the assignment
+            ground_map.update_cluster()
+            ground_map.poll_clusters(wait=True)
+            return ground_map, manager
+
+        def run(fixture):
+            ground_map, manager = fixture
+            manager._assign_targets(ground_map)
+
+        params = {"map": [width, height], "density": density, "uavs": fleet_size}
+        self._time("SwarmManager._assign_targets", params, setup, run)
+
+    def bench_swarm_manager(self, width, height, fleet_size):
+        from .SwarmManager import SwarmManager
+
+        def setup():
+            ground_map = self._make_map(width, height, 0.0)
+            manager = SwarmManager()
+            for uav in self._make_fleet(ground_map, fleet_size):
+                manager.add_uav(uav)
+            return manager
+
+        def run(manager):
+            manager.update()
+
+        params = {"map": [width, height], "uavs": fleet_size}
+        self._time("SwarmManager.update", params, setup, run)
+
+    def bench_clustering(self, width, height, density):
+        params = {"map": [width, height], "density": density}
+
+        def setup():
+            ground_map = self._make_map(width, height, density)
+            xs, ys = np.nonzero(ground_map.values > 0)
+            return ground_map, np.column_stack((xs, ys))
+
+        ground_map, points = setup()
+        if len(points) == 0:
+            return
+        if len(points) > self.max_cluster_points:
+            self.results.append(
+                {"name": "GroundMap.apply_dbscan", "params": params, "skipped": True}
+            )
+            self.results.append(
+                {"name": "GroundMap.apply_kmeans", "params": params, "skipped": True}
+            )
+        else:
+            self._time(
+                "GroundMap.apply_dbscan",
+                params,
+                setup,
+                lambda fixture: fixture[0].apply_dbscan(fixture[1]),
+            )
+            self._time(
+                "GroundMap.apply_kmeans",
+                params,
+                setup,
+                lambda fixture: fixture[0].apply_kmeans(fixture[1]),
+            )
+        self._time(
+            "GroundMap.grid_clusters",
+            params,
+            setup,
+            lambda fixture: fixture[0].grid_clusters(),
+        )
+
+    def bench_aoi_scan(self, width, height, chunked):
+        """
+        Scans eating into one AoI component that covers the whole map, each
+        followed by a cluster update: the cost should not grow with the map.
+        """
+        from .GroundMap import GroundMap
+
+        def setup():
+            ground_map = GroundMap.from_mask(
+                np.ones((width, height), dtype=bool),
+                wind_direction=[0.5, 0.5],
+                wind_strength=10,
+                chunked=chunked,
+            )
+            ground_map.update_cluster()
+            extent = (width * ground_map.cell_size, height * ground_map.cell_size)
+            rng = np.random.default_rng(self.seed)
+            return ground_map, rng.uniform((0, 0), extent, (SCAN_STEPS, 5, 2))
+
+        def run(fixture):
+            ground_map, steps = fixture
+            for positions in steps:
+                ground_map.scan(positions)
+                ground_map.update_cluster()
+
+        params = {"map": [width, height], "chunked": chunked, "scans": SCAN_STEPS}
+        self._time("GroundMap.scan+update_cluster", params, setup, run)
+
+    def bench_render(self, width, height, density, fleet_size):
+        from .Game import Game
+        from .SwarmManager import SwarmManager
+
+        game = Game()
+
+        def setup():
+            ground_map = self._make_map(width, height, density)
+            manager = SwarmManager()
+            for uav in self._make_fleet(ground_map, fleet_size):
+                manager.add_uav(uav)
+            # The first frame paints the map layer; the timed one is steady state
+            ground_map.draw()
+            return ground_map, manager
+
+        def run(fixture):
+            ground_map, manager = fixture
+            game.window.begin_frame("white")
+            ground_map.draw()
+            manager.draw()
+            game.window.present()
+
+        params = {"map": [width, height], "density": density, "uavs": fleet_size}
+        self._time("render", params, setup, run)
+
+    def run(self):
+        """Run every case of the sweep and return the report."""
+        from .Game import Game
+
+        Game()
+        self.results = []
+        sweep = self.sweep
+        for width, height in sweep["map_sizes"]:
+            for chunked in (False, True):
+                self.bench_aoi_scan(width, height, chunked)
+            for density in sweep["densities"]:
+                self.bench_clustering(width, height, density)
+                for fleet_size in sweep["fleet_sizes"]:
+                    self.bench_scan(width, height, density, fleet_size)
+                    self.bench_assign_targets(width, height, density, fleet_size)
+                    self.bench_render(width, height, density, fleet_size)
+            for fleet_size in sweep["fleet_sizes"]:
+                self.bench_swarm_manager(width, height, fleet_size)
+        return self.report()
+
+    def report(self):
+        return {
+            "meta": {
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "repeats": self.repeats,
+                "sweep": self.sweep,
+            },
+            "results": self.results,
+        }
+
+    @staticmethod
+    def save(report, path):
+        with open(path, "w") as file:
+            json.dump(report, file, indent=2)
+
+    @staticmethod
+    def compare(report, baseline, threshold: float = 1.25, floor: float = 1e-3):
+        """
+        Match cases against a baseline report.
+
+        Args:
+            threshold (float): Slowdown ratio that counts as a regression.
+            floor (float): Slowdowns smaller than this many seconds are
+                timer noise and never count.
+
+        Returns:
+            list: (name, params, ratio) for cases slower than threshold x baseline.
+        """
+
+        def key(result):
+            return (result["name"], json.dumps(result["params"], sort_keys=True))
+
+        reference = {
+            key(result): result["seconds"]
+            for result in baseline["results"]
+            if "seconds" in result
+        }
+        regressions = []
+        for result in report["results"]:
+            base = reference.get(key(result))
+            if base and "seconds" in result:
+                ratio = result["seconds"] / base
+                if ratio > threshold and result["seconds"] - base > floor:
+                    regressions.append((result["name"], result["params"], ratio))
+        return regressions
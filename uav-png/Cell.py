@@ -13,22 +13,41 @@ class CellState(Enum):
 
 
 class Cell:
-    def __init__(
-        self,
-        rect: Rect,
-        value: int,
-        state: CellState = CellState.UNKNOWN,
-    ):
-        self.rect = rect
-        self.value = value
-        self.state = state
-        self.state_colors = {
-            CellState.NOT_SCANNED: "pink",
-            CellState.SCANNED: "green",
-            CellState.UNREACHABLE: "red",
-            CellState.UNKNOWN: "blue",
-            CellState.NO_INTEREST: "gray",
-        }
+    """Thin view of one square of a GroundMap; the map owns value and state."""
+
+    state_colors = {
+        CellState.NOT_SCANNED: "pink",
+        CellState.SCANNED: "green",
+        CellState.UNREACHABLE: "red",
+        CellState.UNKNOWN: "blue",
+        CellState.NO_INTEREST: "gray",
+    }
+
+    def __init__(self, ground_map, x: int, y: int):
+        self.ground_map = ground_map
+        self.x = x
+        self.y = y
+
+    @property
+    def rect(self):
+        size = self.ground_map.cell_size
+        return Rect(self.x * size, self.y * size, size, size)
+
+    @property
+    def value(self):
+        return int(self.ground_map.values[self.x, self.y])
+
+    @value.setter
+    def value(self, new_value: int):
+        self.ground_map.set_values([self.x], [self.y], new_value)
+
+    @property
+    def state(self):
+        return CellState(int(self.ground_map.states[self.x, self.y]))
+
+    @state.setter
+    def state(self, new_state: CellState):
+        self.ground_map.set_states([self.x], [self.y], new_state)
 
     def update_value(self, new_value: int):
         self.value = new_value
@@ -43,9 +62,10 @@ class Cell:
         pass
 
     def draw(self):
+        rect = self.rect
         Game().getWindow().draw_rect(
             color=self.state_colors.get(self.state),
-            rect=self.rect,
+            rect=rect,
             border=1,
             border_color="white",
         )
@@ -53,8 +73,8 @@ class Cell:
             Game().getWindow(),
             str(self.value),
             (
-                self.rect.centerx,
-                self.rect.centery,
+                rect.centerx,
+                rect.centery,
             ),
         )
 
@@ -1,8 +1,50 @@
+import numpy as np
+
+
 class Cluster:
-    def __init__(self, centroid: [float, float], radius: float, important_score: int):
+    def __init__(
+        self,
+        centroid: [float, float],
+        radius: float,
+        important_score: int,
+        cells=None,
+    ):
         self.centroid = centroid
         self.radius = radius
         self.important_score = important_score
+        # (n, 2) grid cells of the cluster, and how many are still unscanned;
+        # the GroundMap that applies the cluster keeps remaining current
+        self.cells = cells
+        self.remaining = important_score if cells is None else len(cells)
+        self._path = None
+        self._segments = {}
+
+    def coverage_path(self) -> np.ndarray:
+        """
+        Boustrophedon sweep over the cells, as an (n, 2) array of cells in
+        visiting order: lanes run along the cluster's longer side and
+        alternate direction, so consecutive waypoints stay adjacent.
+        """
+        if self._path is None:
+            if self.cells is None or len(self.cells) == 0:
+                self._path = np.zeros((0, 2), dtype=np.int64)
+                return self._path
+            cells = np.asarray(self.cells)
+            extent = cells.max(axis=0) - cells.min(axis=0)
+            # Lanes are rows when the cluster is wider than tall
+            lane_axis = 1 if extent[0] >= extent[1] else 0
+            lanes = cells[:, lane_axis]
+            along = cells[:, 1 - lane_axis]
+            _, rank = np.unique(lanes, return_inverse=True)
+            along = np.where(rank % 2 == 1, -along, along)
+            self._path = cells[np.lexsort((along, lanes))]
+        return self._path
+
+    def path_segments(self, count: int) -> list[np.ndarray]:
+        """The coverage path cut into count contiguous pieces, one per UAV."""
+        if count not in self._segments:
+            self._segments[count] = np.array_split(self.coverage_path(), count)
+        return self._segments[count]
 
     def draw(self):
         from .Game import Game
@@ -1,121 +1,81 @@
+import os
 import pygame
+from .config import SCENARIO_DIR
 from .engine.GameState import GameState
 from .engine.GameStateManager import GameStateManager
 from .engine.InputManager import InputManager
-from .Uav import Uav
+from .engine.Profiler import Profiler
 from .SwarmManager import SwarmManager
-from .GroundMap import GroundMap
+from .MissionRecorder import MissionRecorder
+from .Scenario import Scenario
 
 
 class DemoState(GameState):
-    def __init__(self):
+    def __init__(
+        self,
+        record_path: str = None,
+        scenario_path: str = None,
+        scenario: Scenario = None,
+    ):
+        """
+        Args:
+            record_path (str): Record the mission here for ReplayState.
+            scenario_path (str): Scenario JSON to fly (defaults to the demo).
+            scenario (Scenario): Already loaded scenario; wins over scenario_path.
+        """
+        if scenario is None:
+            scenario = Scenario.load(
+                scenario_path or os.path.join(SCENARIO_DIR, "demo.json")
+            )
         self.swarm_manager = SwarmManager()
-        uav1 = Uav(
-            remain_energy=100,
-            min_speed=1,
-            max_speed=10,
-            buffer_data=50,
-            pos=[150.0, 300.0],
-            size=30,
-            connection_range=100,
-        )
-        uav2 = Uav(
-            remain_energy=100,
-            min_speed=1,
-            max_speed=10,
-            buffer_data=50,
-            pos=[800.0, 210.0],
-            size=30,
-            connection_range=50,
-        )
-        uav3 = Uav(
-            remain_energy=100,
-            min_speed=1,
-            max_speed=10,
-            buffer_data=50,
-            pos=[300.0, 300.0],
-            size=30,
-            connection_range=70,
-        )
-        uav4 = Uav(
-            remain_energy=100,
-            min_speed=1,
-            max_speed=10,
-            buffer_data=50,
-            pos=[700.0, 200.0],
-            size=30,
-            connection_range=100,
-        )
-        uav5 = Uav(
-            remain_energy=100,
-            min_speed=1,
-            max_speed=10,
-            buffer_data=50,
-            pos=[500.0, 900.0],
-            size=30,
-            connection_range=100,
-        )
+        for uav in scenario.build_fleet():
+            self.swarm_manager.add_uav(uav)
+        self.ground_map = scenario.build_ground_map()
 
-
-        self.swarm_manager.add_uav(uav1)
-        self.swarm_manager.add_uav(uav2)
-        self.swarm_manager.add_uav(uav3)
-
-        self.ground_map = GroundMap(
-            AoI=[
-                (20, 8),
-                (20, 9),
-                (20, 10),
-                (20, 11),
-                (20, 12),
-                (20, 13),
-                (20, 14),
-                (20, 15),
-                (20, 16),
-                (22, 11),
-                (22, 12),
-                (22, 13),
-                (22, 14),
-                (22, 15),
-                (22, 16),
-                (25, 10),
-                (25, 11),
-                (25, 12),
-                (25, 13),
-                (25, 14),
-                (25, 15),
-                (25, 16),
-                (26, 8),
-                (26, 9),
-                (26, 10),
-                (26, 11),
-                (26, 12),
-                (26, 13),
-                (26, 14),
-                (26, 15),
-                (26, 16),
-            ],
-            width=30,
-            height=20,
-            wind_direction=[0.5, 0.5],
-            wind_strength=10,
-        )
+        # Optional binary recording of every tick, for ReplayState
+        self.recorder = None
+        if record_path:
+            self.recorder = MissionRecorder(
+                record_path, self.swarm_manager, self.ground_map
+            )
 
     def update(self):
-        self.ground_map.update()
-        self.swarm_manager.update()
+        with Profiler().section("map.update"):
+            self.ground_map.update()
+        with Profiler().section("swarm.update"):
+            self.swarm_manager.update()
 
-    def handle_events(self):
+    def handle_input(self):
         self._handle_game_state()
+        self._handle_time_warp()
+
+    def handle_events(self):
         self.ground_map.handle_events()
-        self.swarm_manager.handle_events(self.ground_map)
+        with Profiler().section("swarm.events"):
+            self.swarm_manager.handle_events(self.ground_map)
+        if self.recorder is not None:
+            self.recorder.record()
 
     def render(self):
-        self.ground_map.draw()
-        self.swarm_manager.draw()
+        with Profiler().section("cell.draw"):
+            self.ground_map.draw()
+        with Profiler().section("uav.draw"):
+            self.swarm_manager.draw()
+
+        from .Game import Game
+        from .engine.TextManager import TextManager
+
+        window = Game().getWindow()
+        TextManager().print(
+            window,
+            f"x{Game().time_warp:g} {self.ground_map.coverage:.0%}",
+            (window.width - 80, 20),
+            color="black",
+        )
 
     def clean(self):
         """Clean up resources and reset state."""
+        self._close_recorder()
         self.swarm_manager.clean()  # Assuming a clear method exists
         self.ground_map.clean()  # Assuming a clean method exists
 
@@ -124,4 +84,15 @@ class DemoState(GameState):
 
     def _handle_game_state(self):
         if InputManager().is_key_down(pygame.K_ESCAPE):
+            self._close_recorder()
             GameStateManager().pop_state()
+
+    def _close_recorder(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def _handle_time_warp(self):
+        from .Game import Game
+
+        Game().handle_time_warp_input()
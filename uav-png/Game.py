@@ -1,9 +1,11 @@
 import pygame
 import os
+import time
 from .config import IMAGE_DIR
 from .engine.Singleton import Singleton
 from .engine.GameStateManager import GameStateManager
 from .engine.InputManager import InputManager
+from .engine.Profiler import Profiler
 from .engine.Window import Window
 from .MenuState import MenuState
 from .engine.TextureManager import TextureManager
@@ -11,39 +13,142 @@ from .engine.TextureManager import TextureManager
 
 @Singleton
 class Game:
-    def __init__(self, width: int = 1200, height: int = 800, fps: int = 60):
+    MIN_TIME_WARP = 0.25
+    MAX_TIME_WARP = 256.0
+    # Rendered frames that may be skipped in a row while catching up
+    MAX_FRAME_SKIP = 5
+
+    def __init__(
+        self,
+        width: int = 1200,
+        height: int = 800,
+        fps: int = 60,
+        headless: bool = False,
+        dirty_rects: bool = False,
+        profile_path: str = None,
+        time_warp: float = 1.0,
+        record_path: str = None,
+        scenario_path: str = None,
+    ):
         pygame.init()
         self.isRunning = True
-        self.FPS = fps
-        self.window = Window(width, height, self.FPS)
+        self.headless = headless
+        # Where the frame timings are written on exit (.csv or .json)
+        self.profile_path = profile_path
+        # Where demo missions are recorded for replay, if anywhere
+        self.record_path = record_path
+        # Scenario JSON the demo flies; None for the bundled demo
+        self.scenario_path = scenario_path
+        self.FPS = 0 if headless else fps
+        # Fixed simulation timestep: one step per frame at the nominal FPS
+        self.step_time = 1.0 / fps
+        self.time_warp = 1.0
+        self.set_time_warp(time_warp)
+        self._accumulator = 0.0
+        self._skipped_frames = 0
+        self.window = Window(
+            width, height, self.FPS, headless=headless, dirty_rects=dirty_rects
+        )
+        if headless:
+            # No display: textures can't be converted and there is no menu
+            return
+
         self.loadTexture()
         GameStateManager().push_state(MenuState())
 
     def loadTexture(self):
         TextureManager().load_texture("uav", os.path.join(IMAGE_DIR, "uav.png"))
 
-    def update(self):
-        GameStateManager().update()
+    def set_time_warp(self, time_warp: float):
+        """Simulated seconds per real second, clamped to the allowed range."""
+        self.time_warp = min(max(time_warp, self.MIN_TIME_WARP), self.MAX_TIME_WARP)
+
+    def handle_time_warp_input(self):
+        """'+' / '-' double or halve the simulation speed, '0' resets it."""
+        if InputManager().is_key_down(pygame.K_EQUALS) or InputManager().is_key_down(
+            pygame.K_KP_PLUS
+        ):
+            self.set_time_warp(self.time_warp * 2)
+        if InputManager().is_key_down(pygame.K_MINUS) or InputManager().is_key_down(
+            pygame.K_KP_MINUS
+        ):
+            self.set_time_warp(self.time_warp / 2)
+        if InputManager().is_key_down(pygame.K_0):
+            self.set_time_warp(1.0)
+
+    def tick(self):
+        """
+        Run one rendered frame: poll input once, advance the simulation by
+        as many fixed steps as real time times time_warp calls for, then
+        render unless the simulation is still behind.
+        """
+        with Profiler().section("wait"):
+            elapsed = self.window.handle_FPS() / 1000
+
+        self.handle_event()
+        if not self.update(elapsed):
+            return
+        self.render()
 
     def handle_event(self):
-        self.window.handle_FPS()
-        InputManager().update()
+        """Poll input once and let the active state react to it."""
+        with Profiler().section("input"):
+            InputManager().update()
 
-        if InputManager().is_quit():
-            self.quit()
+            if InputManager().is_quit():
+                self.quit()
+            if InputManager().is_key_down(pygame.K_F3):
+                Profiler().toggle_overlay()
 
-        GameStateManager().handle_events()
+            GameStateManager().handle_input()
+
+    def update(self, elapsed: float) -> bool:
+        """
+        Advance the simulation by the fixed steps owed for elapsed real
+        seconds.
+
+        Returns:
+            bool: Whether this frame should be rendered.
+        """
+        self._accumulator += elapsed * self.time_warp
+        # Never owe more than a few frames of steps, or a simulation that
+        # can't keep up would run flat out long after the warp is lowered
+        self._accumulator = min(
+            self._accumulator, self.MAX_FRAME_SKIP * self.step_time * self.time_warp
+        )
+        start = time.perf_counter()
+        with Profiler().section("simulate"):
+            while self._accumulator >= self.step_time:
+                GameStateManager().update()
+                GameStateManager().handle_events()
+                self._accumulator -= self.step_time
+                # Give the renderer a chance at least once per frame period
+                if time.perf_counter() - start > self.step_time:
+                    break
+
+        behind = self._accumulator >= self.step_time
+        if behind and self._skipped_frames < self.MAX_FRAME_SKIP:
+            self._skipped_frames += 1
+            return False
+        self._skipped_frames = 0
+        return True
 
     def render(self):
-        self.window.fill("white")
-        GameStateManager().render()
-        pygame.display.flip()
+        with Profiler().section("render"):
+            self.window.begin_frame("white")
+            GameStateManager().render()
+            Profiler().draw_overlay(self.window)
+
+        with Profiler().section("present"):
+            self.window.present()
 
     def quit(self):
         self.isRunning = False
 
     def clean(self):
         GameStateManager().clean()
+        if self.profile_path:
+            Profiler().dump(self.profile_path)
         pygame.quit()
 
     def getWindow(self):
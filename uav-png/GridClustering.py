@@ -0,0 +1,314 @@
+import numpy as np
+from scipy import ndimage
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from .engine.TileGrid import TileGrid
+from .engine.UnionFind import UnionFind
+
+
+class GridClustering:
+    """
+    4-connected components of a boolean grid, kept up to date as cells are
+    removed. On integer cell coordinates this is exactly
+    DBSCAN(eps=1, min_samples=1), without refitting the whole map.
+
+    Removing cells only unlabels them and marks their components dirty.
+    Whether a dirty component fell apart is settled by flush(), locally:
+    floods from the removed cells' neighbours stop as soon as they meet
+    again, so a component that merely shrank is never walked in full and
+    keeps its label.
+    """
+
+    def __init__(self, mask):
+        """
+        Args:
+            mask (np.ndarray | TileGrid): (width, height) bool grid of cells
+                to cluster. A TileGrid mask is labelled tile by tile and
+                keeps the labels sparse too.
+        """
+        if isinstance(mask, TileGrid):
+            self.labels = TileGrid(mask.shape, np.int32, -1, mask.tile_size)
+        else:
+            self.labels = np.full(mask.shape, -1, dtype=np.int32)
+        # label -> (xs, ys) of its cells; may still list cells that have
+        # since been removed or split off, see cells()
+        self.components = {}
+        self.counts = {}  # label -> cells currently holding the label
+        self.sums = {}  # label -> [sum of xs, sum of ys] of those cells
+        self.changed = set()  # labels added, removed or shrunk since the last drain
+        self._removed = {}  # label -> [(xs, ys), ...] removed since the last flush
+        self._next_label = 0
+        self.rebuild(mask)
+
+    def rebuild(self, mask):
+        """Label every component of mask from scratch."""
+        self.changed.update(self.components)
+        self.labels[:] = -1
+        self.components = {}
+        self.counts = {}
+        self.sums = {}
+        self._removed = {}
+        if isinstance(mask, TileGrid):
+            self._label_tiles(mask)
+        else:
+            self._label_region(np.asarray(mask, dtype=bool), 0, 0)
+
+    def _label_region(self, mask, x0, y0):
+        """Give fresh labels to the components of mask, a window at (x0, y0)."""
+        region, count = ndimage.label(mask)
+        if count == 0:
+            return
+
+        xs, ys = np.nonzero(region)
+        self._add_components(xs + x0, ys + y0, region[xs, ys])
+
+    def _label_tiles(self, mask: TileGrid):
+        """
+        Give fresh labels to the components of a sparse mask: each tile is
+        labelled on its own, then labels touching across tile edges are
+        joined with union-find.
+        """
+        size = mask.tile_size
+        regions = {}
+        offsets = {}
+        total = 0
+        for key, tile in mask.tiles.items():
+            region, count = ndimage.label(tile)
+            if count:
+                regions[key] = region
+                offsets[key] = total - 1  # Local labels start at 1
+                total += count
+        if total == 0:
+            return
+
+        groups = UnionFind(total)
+        for (tx, ty), region in regions.items():
+            for neighbour, edge, other_edge in (
+                ((tx + 1, ty), region[-1, :], lambda other: other[0, :]),
+                ((tx, ty + 1), region[:, -1], lambda other: other[:, 0]),
+            ):
+                if neighbour not in regions:
+                    continue
+                other = other_edge(regions[neighbour])
+                touching = (edge > 0) & (other > 0)
+                pairs = np.unique(
+                    np.column_stack((edge[touching], other[touching])), axis=0
+                )
+                for a, b in pairs.tolist():
+                    groups.union(offsets[(tx, ty)] + a, offsets[neighbour] + b)
+
+        roots = np.array([groups.find(item) for item in range(total)])
+        xs, ys, components = [], [], []
+        for (tx, ty), region in regions.items():
+            local_xs, local_ys = np.nonzero(region)
+            xs.append(local_xs + tx * size)
+            ys.append(local_ys + ty * size)
+            components.append(roots[offsets[(tx, ty)] + region[local_xs, local_ys]])
+        self._add_components(
+            np.concatenate(xs), np.concatenate(ys), np.concatenate(components)
+        )
+
+    def _add_components(self, xs, ys, component_ids):
+        """Give each component id's cells a fresh label."""
+        order = np.argsort(component_ids, kind="stable")
+        xs, ys, local = xs[order], ys[order], component_ids[order]
+        bounds = np.flatnonzero(np.diff(local)) + 1
+        for cx, cy in zip(np.split(xs, bounds), np.split(ys, bounds)):
+            self._new_component(cx, cy)
+
+    def _new_component(self, cx, cy):
+        label = self._next_label
+        self._next_label += 1
+        self.labels[cx, cy] = label
+        self.components[label] = (cx, cy)
+        self.counts[label] = len(cx)
+        self.sums[label] = np.array([cx.sum(), cy.sum()], dtype=np.int64)
+        self.changed.add(label)
+        return label
+
+    def remove(self, xs, ys):
+        """
+        Drop cells (without repeats) from their components. Only the cells
+        are touched; splits are found by the next flush().
+        """
+        xs, ys = np.asarray(xs), np.asarray(ys)
+        hit = self.labels[xs, ys]
+        held = hit >= 0
+        if not held.any():
+            return
+
+        xs, ys, hit = xs[held], ys[held], hit[held]
+        self.labels[xs, ys] = -1
+        order = np.argsort(hit, kind="stable")
+        xs, ys, hit = xs[order], ys[order], hit[order]
+        bounds = np.flatnonzero(np.diff(hit)) + 1
+        for cx, cy, label in zip(
+            np.split(xs, bounds), np.split(ys, bounds), hit[np.append(0, bounds)]
+        ):
+            label = int(label)
+            self.counts[label] -= len(cx)
+            self.sums[label] -= (int(cx.sum()), int(cy.sum()))
+            self._removed.setdefault(label, []).append((cx, cy))
+            self.changed.add(label)
+
+    def flush(self):
+        """Split off the pieces that dirty components fell apart into."""
+        removed, self._removed = self._removed, {}
+        for label, parts in removed.items():
+            if self.counts[label] == 0:
+                del self.components[label], self.counts[label], self.sums[label]
+                continue
+            rx = np.concatenate([cx for cx, _ in parts])
+            ry = np.concatenate([cy for _, cy in parts])
+            self._split(label, rx, ry)
+            self._compact(label)
+
+    def _neighbours(self, xs, ys, label):
+        """In-bounds 4-neighbours of cells that hold label, as flat indices."""
+        width, height = self.labels.shape
+        nx = np.concatenate((xs + 1, xs - 1, xs, xs))
+        ny = np.concatenate((ys, ys, ys + 1, ys - 1))
+        inside = (nx >= 0) & (nx < width) & (ny >= 0) & (ny < height)
+        nx, ny = nx[inside], ny[inside]
+        held = self.labels[nx, ny] == label
+        return nx[held] * height + ny[held], np.flatnonzero(inside)[held]
+
+    def _split(self, label, rx, ry):
+        """
+        Check every 4-connected patch of removed cells on its own: if the
+        cells around each patch still connect to each other, the component
+        is whole, since any path through a patch can go around it instead.
+        A piece that splits off blocks paths too, so it joins the patches it
+        touches into one, which is checked again.
+        """
+        height = self.labels.shape[1]
+        removed = np.unique(rx * height + ry)
+        rows, columns = [], []
+        for step, valid in (
+            (height, np.ones(len(removed), dtype=bool)),
+            # A step along y must not wrap into the next column
+            (1, removed % height != height - 1),
+        ):
+            neighbour = removed + step
+            index = np.minimum(np.searchsorted(removed, neighbour), len(removed) - 1)
+            adjacent = valid & (removed[index] == neighbour)
+            rows.append(np.flatnonzero(adjacent))
+            columns.append(index[adjacent])
+        rows, columns = np.concatenate(rows), np.concatenate(columns)
+        graph = coo_matrix(
+            (np.ones(len(rows), dtype=bool), (rows, columns)),
+            shape=(len(removed), len(removed)),
+        )
+        count, patches = connected_components(graph, directed=False)
+        px, py = np.divmod(removed, height)
+        seeds, source = self._neighbours(px, py, label)
+        seed_patch = np.tile(patches, 4)[source]
+
+        merged = UnionFind(count)
+        members = {patch: np.flatnonzero(seed_patch == patch) for patch in range(count)}
+        pending = list(range(count))
+        while pending and self.counts[label]:
+            patch = pending.pop()
+            if merged.find(patch) != patch:
+                continue
+            group = members[patch]
+            gx, gy = np.divmod(seeds[group], height)
+            group = group[self.labels[gx, gy] == label]
+            members[patch] = group
+            for piece in self._split_around(label, np.unique(seeds[group])):
+                touching = np.unique(seed_patch[np.isin(seeds, piece)]).tolist()
+                for other in touching:
+                    root, other = merged.find(patch), merged.find(other)
+                    if root != other:
+                        patch = merged.union(root, other)
+                        members[patch] = np.concatenate(
+                            (members.pop(root), members.pop(other))
+                        )
+                pending.append(patch)
+
+    def _split_around(self, label, seeds):
+        """
+        Flood from the seeds, one layer per round for every seed at once.
+        Floods that meet are joined; once one joined flood is left running,
+        every flood that ran dry before joining it is a piece that split
+        off, and gets a new label. Returns the flat cells of those pieces.
+        """
+        if len(seeds) <= 1:
+            return []
+        height = self.labels.shape[1]
+        groups = UnionFind(len(seeds))
+        owner = dict(zip(seeds.tolist(), range(len(seeds))))
+        frontier, frontier_owner = seeds, np.arange(len(seeds))
+        while len({groups.find(seed) for seed in set(frontier_owner.tolist())}) > 1:
+            fx, fy = np.divmod(frontier, height)
+            candidates, source = self._neighbours(fx, fy, label)
+            sources = np.tile(frontier_owner, 4)[source]
+            next_cells, next_owner = [], []
+            for cell, seed in zip(candidates.tolist(), sources.tolist()):
+                seen = owner.get(cell)
+                if seen is None:
+                    owner[cell] = seed
+                    next_cells.append(cell)
+                    next_owner.append(seed)
+                elif seen != seed:
+                    groups.union(seen, seed)
+            frontier = np.array(next_cells, dtype=np.int64)
+            frontier_owner = np.array(next_owner, dtype=np.int64)
+
+        cells = np.fromiter(owner.keys(), dtype=np.int64, count=len(owner))
+        roots = np.array(
+            [groups.find(seed) for seed in owner.values()], dtype=np.int64
+        )
+        if len(frontier_owner):
+            keep = groups.find(int(frontier_owner[0]))
+        elif len(cells) == self.counts[label]:
+            # Every flood ran dry over the whole component: the largest
+            # piece keeps the label
+            keep = np.bincount(roots).argmax()
+        else:
+            # The rest of the component lies beyond these pieces
+            keep = -1
+        pieces = []
+        for root in np.unique(roots[roots != keep]).tolist():
+            piece = cells[roots == root]
+            px, py = np.divmod(piece, height)
+            self.counts[label] -= len(px)
+            self.sums[label] -= (int(px.sum()), int(py.sum()))
+            self._new_component(px, py)
+            pieces.append(piece)
+        return pieces
+
+    def _compact(self, label):
+        """Forget cells that left a component once they are the majority."""
+        cx, cy = self.components[label]
+        if len(cx) > 2 * self.counts[label]:
+            self.components[label] = self.cells(label)
+
+    def cells(self, label):
+        """(xs, ys) of the cells that currently hold label."""
+        cx, cy = self.components[label]
+        keep = self.labels[cx, cy] == label
+        return cx[keep], cy[keep]
+
+    @property
+    def dirty(self) -> bool:
+        """Whether anything changed since the last drain_changed()."""
+        return bool(self.changed or self._removed)
+
+    def drain_changed(self):
+        """Labels added or removed since the previous call."""
+        changed, self.changed = self.changed, set()
+        return changed
+
+    def coordinates(self):
+        """All clustered cells as an (n, 2) array."""
+        self.flush()
+        if not self.components:
+            return np.zeros((0, 2), dtype=np.int64)
+        cells = [self.cells(label) for label in self.components]
+        return np.column_stack(
+            (
+                np.concatenate([cx for cx, _ in cells]),
+                np.concatenate([cy for _, cy in cells]),
+            )
+        )
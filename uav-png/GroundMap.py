@@ -1,9 +1,165 @@
+from collections.abc import Mapping
 from .Cell import Cell, CellState
-from pygame import Rect
 from sklearn.cluster import DBSCAN, KMeans
 from .Cluster import Cluster
+from .GridClustering import GridClustering
+from .engine.Profiler import Profiler
+from .engine.TileGrid import TileGrid
+from collections import OrderedDict
+from concurrent import futures
+from functools import partial
+import multiprocessing
 import numpy as np
-import threading
+
+# Cells in these states never need a UAV again
+SETTLED_STATES = (CellState.SCANNED, CellState.UNREACHABLE, CellState.NO_INTEREST)
+# Largest first-scan tick GroundMap.scan_ticks can hold, relative to a rebuild
+SCAN_TICK_LIMIT = np.iinfo(np.uint16).max
+
+
+class CellChangeLog:
+    """Cells touched since the last drain(), collected for one consumer."""
+
+    def __init__(self):
+        self._xs = []
+        self._ys = []
+        # Set when the whole grid was rebuilt and per-cell deltas are moot
+        self.reset = True
+
+    def record(self, xs, ys):
+        if not self.reset:
+            self._xs.append(np.array(xs, dtype=np.int64, ndmin=1))
+            self._ys.append(np.array(ys, dtype=np.int64, ndmin=1))
+
+    def mark_reset(self):
+        self.reset = True
+        self._xs, self._ys = [], []
+
+    def drain(self):
+        """Unique (xs, ys) recorded since the last call; clears the log."""
+        xs, ys = self._xs, self._ys
+        self._xs, self._ys = [], []
+        self.reset = False
+        if not xs:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        cells = np.column_stack((np.concatenate(xs), np.concatenate(ys)))
+        cells = np.unique(cells, axis=0)
+        return cells[:, 0], cells[:, 1]
+
+
+class CellGrid(Mapping):
+    """Read-only ``(x, y) -> Cell`` mapping over the arrays of a GroundMap."""
+
+    def __init__(self, ground_map):
+        self.ground_map = ground_map
+
+    def __getitem__(self, key):
+        x, y = key
+        if not (0 <= x < self.ground_map.width and 0 <= y < self.ground_map.height):
+            raise KeyError(key)
+        return Cell(self.ground_map, x, y)
+
+    def __iter__(self):
+        for x in range(self.ground_map.width):
+            for y in range(self.ground_map.height):
+                yield (x, y)
+
+    def __len__(self):
+        return self.ground_map.width * self.ground_map.height
+
+    def __contains__(self, key):
+        try:
+            x, y = key
+        except (TypeError, ValueError):
+            return False
+        return 0 <= x < self.ground_map.width and 0 <= y < self.ground_map.height
+
+
+def cell_hashes(xs, ys, height):
+    """Well-mixed 64-bit hash per cell (splitmix64 of its flat index)."""
+    z = np.asarray(xs, dtype=np.uint64) * np.uint64(height) + np.asarray(
+        ys, dtype=np.uint64
+    )
+    z = z + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def make_cluster(cluster_points, cell_size) -> Cluster:
+    centroid = np.mean(cluster_points, axis=0) * cell_size
+    distances = np.linalg.norm(cluster_points - centroid, axis=1)
+    radius = np.max(distances) * cell_size
+    return Cluster(
+        centroid=centroid,
+        radius=radius,
+        important_score=len(cluster_points),
+        cells=np.asarray(cluster_points),
+    )
+
+
+def dbscan_clusters(AoI, cell_size, eps=1.0, min_samples=1) -> list[Cluster]:
+    coordinates = np.asarray(AoI).reshape(-1, 2)
+    dbscan = DBSCAN(eps=eps, min_samples=min_samples)
+    dbscan.fit(coordinates)
+    clusters = []
+    for label in set(dbscan.labels_):
+        if label == -1:
+            continue
+        cluster_points = coordinates[dbscan.labels_ == label]
+        clusters.append(make_cluster(cluster_points, cell_size))
+    return clusters
+
+
+def kmeans_clusters(AoI, cell_size, n_clusters=3) -> list[Cluster]:
+    coordinates = np.asarray(AoI).reshape(-1, 2)
+    if len(coordinates) < n_clusters:
+        n_clusters = len(coordinates)
+    kmeans = KMeans(n_clusters=n_clusters, n_init=10)
+    labels = kmeans.fit_predict(coordinates)
+    clusters = []
+    for label in set(labels):
+        cluster_points = coordinates[labels == label]
+        clusters.append(make_cluster(cluster_points, cell_size))
+    return clusters
+
+
+def cluster_job(AoI, cell_size, method, n_clusters) -> list[Cluster]:
+    """Clustering entry point run inside the worker pool."""
+    if method == "dbscan":
+        return dbscan_clusters(AoI, cell_size)
+    if method == "kmeans":
+        return kmeans_clusters(AoI, cell_size, n_clusters)
+    raise ValueError(f"Unknown clustering method '{method}'")
+
+
+def warm_up():
+    """No-op job: unpickling it makes a fresh worker import this module."""
+
+
+_cluster_executor = None
+
+
+def shared_cluster_executor():
+    """
+    Single-worker process pool reused by every GroundMap. The worker is
+    spawned, not forked, so it never inherits pygame's or OpenMP's threads;
+    it starts loading sklearn right away, as that takes a second or two.
+    """
+    global _cluster_executor
+    if _cluster_executor is None:
+        _cluster_executor = futures.ProcessPoolExecutor(
+            max_workers=1, mp_context=multiprocessing.get_context("spawn")
+        )
+        _cluster_executor.submit(warm_up)
+    return _cluster_executor
+
+
+def set_shared_cluster_executor(executor: futures.Executor):
+    """Replace the pool used by every GroundMap without an executor of its own."""
+    global _cluster_executor
+    _cluster_executor = executor
 
 
 class GroundMap:
@@ -14,131 +170,641 @@ class GroundMap:
         height: float,
         wind_direction: [float, float],
         wind_strength: float,
+        cell_size: int = None,
+        executor: futures.Executor = None,
+        cluster_cache_size: int = 32,
+        chunked: bool = False,
+        tile_size: int = 64,
+        cluster_method: str = "dbscan",
+        n_clusters: int = 3,
     ):
-        self.cells = {}
         self.wind_direction = wind_direction
         self.wind_strength = wind_strength
         self.width = width
         self.height = height
         self.AoI = AoI
-        self.updating_cluster = False
+        # Clustering jobs run on a reusable pool; every submission gets a
+        # generation so late results from older snapshots are dropped
+        self._executor = executor
+        if cluster_method != "dbscan":
+            # Start the pool now, so its worker is up by the first request
+            self.executor
+        self._cluster_jobs = []
+        self._cluster_request = None
+        self.cluster_generation = 0
+        self._applied_generation = 0
+        # Finished clusterings keyed by (AoI fingerprint, method, params)
+        self._cluster_cache = OrderedDict()
+        self.cluster_cache_size = cluster_cache_size
+        self.cluster_cache_hits = 0
+        self.cluster_cache_misses = 0
+        # Defaults of update_cluster, and how often it was asked for
+        self.cluster_method = cluster_method
+        self.n_clusters = n_clusters
+        self.cluster_calls = 0
+        # XOR of cell_hashes over the remaining AoI, and its size
+        self._aoi_hash = 0
+        self._aoi_remaining = 0
+        if cell_size is None:
+            cell_size = self._fit_cell_size()
+        self.cell_size = cell_size
+
+        # Structure of arrays, indexed [x, y]; Cell objects are only views.
+        # Chunked maps keep them as TileGrids that only allocate the tiles
+        # holding AoI or visited cells
+        self.chunked = chunked
+        self.tile_size = tile_size
+        self.values = self._new_grid(np.uint8, 0)
+        self.states = self._new_grid(np.uint8, CellState.NO_INTEREST.value)
+        # Maintained index of cells that still need a visit
+        self.pending = self._new_grid(bool, False)
+        # Coverage bookkeeping, kept current by set_states / set_values:
+        # cells per CellState, the tick each cell was first scanned at and,
+        # per applied cluster, its cells still in the AoI. Scan ticks are
+        # stored as 1 + ticks since the grid was last rebuilt (0 if never),
+        # saturating at the top of uint16; see first_scan_ticks()
+        self.tick = 0
+        self.state_counts = np.zeros(len(CellState), dtype=np.int64)
+        self.scan_ticks = self._new_grid(np.uint16, 0)
+        self._scan_tick_base = 0
+        # Grid clusters are found from the component labels; snapshot
+        # clusters (k-means) from 1 + their index in _slot_clusters, kept
+        # in the smallest dtype that fits and only while they are applied
+        self.cluster_slots = None
+        self._slot_clusters = []
+        self.cells = CellGrid(self)
+        # Incremental DBSCAN(eps=1) labels, created on first use
+        self._grid_clustering = None
+        self._grid_clusters = {}
+        self._change_logs = []
+        self._layer = None
+        self._build_grid()
+
+        self.clusters = []
+
+    @classmethod
+    def from_mask(
+        cls,
+        mask,
+        wind_direction: [float, float],
+        wind_strength: float,
+        **kwargs,
+    ):
+        """
+        Build a map from a (width, height) grid whose nonzero cells are the
+        AoI, in bulk. The mask may be a read-only memory map.
+
+        Args:
+            mask (np.ndarray): (width, height) AoI mask, indexed [x, y].
+            wind_direction ([float, float]): Wind direction.
+            wind_strength (float): Wind strength.
+            **kwargs: Passed on to GroundMap (cell_size, chunked, ...).
+        """
+        width, height = mask.shape
+        # Read the mask in strips so only the AoI coordinates are ever held
+        # in memory, whatever the size of the mask
+        strip = max(1, (1 << 22) // max(height, 1))
+        xs, ys = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+        for x0 in range(0, width, strip):
+            strip_xs, strip_ys = np.nonzero(np.asarray(mask[x0 : x0 + strip]))
+            xs.append(strip_xs + x0)
+            ys.append(strip_ys)
+        return cls(
+            AoI=np.column_stack((np.concatenate(xs), np.concatenate(ys))),
+            width=width,
+            height=height,
+            wind_direction=wind_direction,
+            wind_strength=wind_strength,
+            **kwargs,
+        )
+
+    def _new_grid(self, dtype, fill):
+        """(width, height) grid of fill, dense or chunked like this map."""
+        if self.chunked:
+            return TileGrid((self.width, self.height), dtype, fill, self.tile_size)
+        return np.full((self.width, self.height), fill, dtype=dtype)
+
+    def _fit_cell_size(self):
+        """Largest square cell size that fits the whole map in the window."""
         from .Game import Game
 
-        self.cell_size = min(
-            Game().getWindow().width // self.width,
-            Game().getWindow().height // self.height,
+        window = Game().getWindow()
+        return max(1, min(window.width // self.width, window.height // self.height))
+
+    def _aoi_coordinates(self):
+        """AoI as an (n, 2) integer array of (x, y) cells."""
+        return np.asarray(self.AoI, dtype=np.int64).reshape(-1, 2)
+
+    def _build_grid(self):
+        """(Re)initialise values and states from the AoI in bulk."""
+        self.values[:] = 0
+        self.states[:] = CellState.NO_INTEREST.value
+        coordinates = self._aoi_coordinates()
+        xs, ys = coordinates[:, 0], coordinates[:, 1]
+        self.values[xs, ys] = 1
+        self.states[xs, ys] = CellState.NOT_SCANNED.value
+        self.pending[:] = False
+        self.pending[xs, ys] = True
+        self._grid_rebuilt()
+
+    def set_grid(self, xs, ys, states, values):
+        """
+        Replace the whole grid with a blank one (no interest, value 0) that
+        holds only the given cells, so chunked maps stay sparse.
+
+        Args:
+            xs, ys (np.ndarray): Coordinates of the cells to set.
+            states (np.ndarray): CellState value of each cell.
+            values (np.ndarray): Value of each cell.
+        """
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        states = np.asarray(states, dtype=np.uint8)
+        self.states[:] = CellState.NO_INTEREST.value
+        self.values[:] = 0
+        self.pending[:] = False
+        self.states[xs, ys] = states
+        self.values[xs, ys] = values
+        self.pending[xs, ys] = ~np.isin(
+            states, [state.value for state in SETTLED_STATES]
         )
+        interest = states != CellState.NO_INTEREST.value
+        self.AoI = np.column_stack((xs[interest], ys[interest]))
+        self._grid_rebuilt()
 
-        for x in range(0, self.width):
-            for y in range(0, self.height):
-                rect = Rect(
-                    x * self.cell_size,
-                    y * self.cell_size,
-                    self.cell_size,
-                    self.cell_size,
-                )
+    def occupied_cells(self):
+        """
+        (xs, ys) of every cell that differs from a blank grid, in x-major
+        order; with their states and values they are all set_grid needs.
+        """
+        state_xs, state_ys = np.nonzero(self.states != CellState.NO_INTEREST.value)
+        value_xs, value_ys = np.nonzero(self.values != 0)
+        flat = np.union1d(
+            np.ravel_multi_index((state_xs, state_ys), self.values.shape),
+            np.ravel_multi_index((value_xs, value_ys), self.values.shape),
+        )
+        return np.unravel_index(flat, self.values.shape)
 
-                cell_value = 0
-                cell_state = CellState.NO_INTEREST
-                if (x, y) in AoI:
-                    cell_value = 1
-                    cell_state = CellState.NOT_SCANNED
+    def _grid_rebuilt(self):
+        """Bring hashes, labels, counters and change logs in line with a new grid."""
+        self._rehash_aoi()
+        self._count_states()
+        self.scan_ticks[:] = 0
+        self._scan_tick_base = self.tick
+        self._set_clusters([])
+        if self._grid_clustering is not None:
+            self._grid_clustering.rebuild(self.values > 0)
+        for log in self._change_logs:
+            log.mark_reset()
 
-                cell = Cell(rect, cell_value, cell_state)
-                self.cells[(x, y)] = cell
+    def track_changes(self) -> CellChangeLog:
+        """Start recording every cell whose value or state changes."""
+        log = CellChangeLog()
+        self._change_logs.append(log)
+        return log
 
-        self.clusters = []
+    def untrack_changes(self, log: CellChangeLog):
+        if log in self._change_logs:
+            self._change_logs.remove(log)
 
-    def update_cluster(self, method="dbscan", n_clusters=3):
-        if not self.updating_cluster:
-            self.updating_cluster = True
-            thread = threading.Thread(
-                target=self._run_clustering, args=(method, n_clusters), daemon=True
+    def _count_states(self):
+        if self.chunked:
+            for state in CellState:
+                self.state_counts[state.value] = (self.states == state.value).sum()
+        else:
+            self.state_counts[:] = np.bincount(
+                self.states.ravel(), minlength=len(CellState)
             )
-            thread.start()
 
-    def _run_clustering(self, method, n_clusters):
-        """Performs clustering in a separate thread."""
-        remainAoI = [cell for cell in self.AoI if self.cells[cell].value > 0]
-        if not remainAoI:
-            self.updating_cluster = False
+    def _rehash_aoi(self):
+        xs, ys = np.nonzero(self.values > 0)
+        self._aoi_hash = self._xor_hashes(xs, ys)
+        self._aoi_remaining = len(xs)
+
+    def _xor_hashes(self, xs, ys) -> int:
+        hashes = cell_hashes(xs, ys, self.height)
+        return int(np.bitwise_xor.reduce(hashes, initial=np.uint64(0)))
+
+    def _unique_cells(self, xs, ys):
+        flat = np.unique(np.ravel_multi_index((xs, ys), self.values.shape))
+        return np.unravel_index(flat, self.values.shape)
+
+    def _update_aoi_hash(self, xs, ys, remaining: bool):
+        """
+        Fold cells entering or leaving the remaining AoI into the fingerprint.
+        xs, ys must not repeat a cell.
+        """
+        flipped = (self.values[xs, ys] > 0) != remaining
+        xs, ys = xs[flipped], ys[flipped]
+        if not len(xs):
             return
+        self._aoi_hash ^= self._xor_hashes(xs, ys)
+        self._aoi_remaining += len(xs) if remaining else -len(xs)
+
+    @property
+    def aoi_fingerprint(self):
+        """Cheap identity of the remaining-AoI bitmap: (xor hash, cell count)."""
+        return (self._aoi_hash, self._aoi_remaining)
+
+    def set_states(self, xs, ys, state: CellState):
+        """Set the state of every cell (xs[i], ys[i])."""
+        xs, ys = self._unique_cells(xs, ys)
+        self.state_counts -= np.bincount(
+            self.states[xs, ys], minlength=len(CellState)
+        )
+        self.state_counts[state.value] += len(xs)
+        if state == CellState.SCANNED:
+            first = self.scan_ticks[xs, ys] == 0
+            tick = min(self.tick - self._scan_tick_base + 1, SCAN_TICK_LIMIT)
+            self.scan_ticks[xs[first], ys[first]] = tick
+        self.states[xs, ys] = state.value
+        self.pending[xs, ys] = state not in SETTLED_STATES
+        for log in self._change_logs:
+            log.record(xs, ys)
+
+    def set_values(self, xs, ys, value: int):
+        """Set the value of every cell (xs[i], ys[i])."""
+        xs, ys = self._unique_cells(xs, ys)
+        if len(xs):
+            self._update_aoi_hash(xs, ys, value > 0)
+        if value == 0:
+            self._leave_clusters(xs, ys)
+        self.values[xs, ys] = value
+        if self._grid_clustering is not None:
+            if value == 0:
+                self._grid_clustering.remove(xs, ys)
+            else:
+                self._grid_clustering.rebuild(self.values > 0)
+        for log in self._change_logs:
+            log.record(xs, ys)
+
+    def cell_indices(self, positions):
+        """
+        Grid coordinates under each world position, computed from cell_size.
+
+        Args:
+            positions (array-like): (n, 2) world positions.
+
+        Returns:
+            tuple: (xs, ys, inside) where inside masks positions on the map.
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        indices = np.floor(positions / self.cell_size).astype(np.int64)
+        xs, ys = indices[:, 0], indices[:, 1]
+        inside = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        return xs, ys, inside
+
+    def cell_at(self, position):
+        """The Cell under a world position, or None if it is off the map."""
+        xs, ys, inside = self.cell_indices(position)
+        if not inside[0]:
+            return None
+        return Cell(self, int(xs[0]), int(ys[0]))
 
+    def scan(self, positions):
+        """
+        Scan the NOT_SCANNED cells under a batch of world positions.
+
+        Returns:
+            tuple: (xs, ys) of the cells that were newly scanned.
+        """
+        xs, ys, inside = self.cell_indices(positions)
+        xs, ys = xs[inside], ys[inside]
+        pending = self.states[xs, ys] == CellState.NOT_SCANNED.value
+        xs, ys = xs[pending], ys[pending]
+        if not len(xs):
+            return xs, ys
+        self.set_states(xs, ys, CellState.SCANNED)
+        self.set_values(xs, ys, 0)
+        return xs, ys
+
+    def cell_centers(self, xs, ys):
+        """World-space centres of cells (xs[i], ys[i]) as an (n, 2) array."""
+        half = self.cell_size // 2
+        return np.column_stack(
+            (
+                np.asarray(xs) * self.cell_size + half,
+                np.asarray(ys) * self.cell_size + half,
+            )
+        )
+
+    def query_radius(self, center, radius):
+        """
+        Pending cells whose centre lies within radius of a world position.
+
+        Only the squares inside the disc's bounding box are examined, and
+        scanned, unreachable and no-interest squares are skipped through the
+        pending index.
+
+        Returns:
+            tuple: (xs, ys) of matching cells in x-major order.
+        """
+        cx, cy = float(center[0]), float(center[1])
+        half = self.cell_size // 2
+        x0 = max(int(np.ceil((cx - radius - half) / self.cell_size)), 0)
+        x1 = min(int(np.floor((cx + radius - half) / self.cell_size)) + 1, self.width)
+        y0 = max(int(np.ceil((cy - radius - half) / self.cell_size)), 0)
+        y1 = min(int(np.floor((cy + radius - half) / self.cell_size)) + 1, self.height)
+        if x0 >= x1 or y0 >= y1:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        xs, ys = np.nonzero(self.pending[x0:x1, y0:y1])
+        xs += x0
+        ys += y0
+        dx = xs * self.cell_size + half - cx
+        dy = ys * self.cell_size + half - cy
+        inside = dx * dx + dy * dy <= radius * radius
+        return xs[inside], ys[inside]
+
+    def cells_in_radius(self, center, radius) -> list[Cell]:
+        """Pending cells within radius of a world position, as Cell views."""
+        xs, ys = self.query_radius(center, radius)
+        return [Cell(self, int(x), int(y)) for x, y in zip(xs, ys)]
+
+    def count_cells(self, state: CellState) -> int:
+        """Number of cells currently in the given state."""
+        return int(self.state_counts[state.value])
+
+    @property
+    def remaining_count(self) -> int:
+        return self.count_cells(CellState.NOT_SCANNED)
+
+    @property
+    def scanned_count(self) -> int:
+        return self.count_cells(CellState.SCANNED)
+
+    @property
+    def unreachable_count(self) -> int:
+        return self.count_cells(CellState.UNREACHABLE)
+
+    @property
+    def aoi_count(self) -> int:
+        """Cells of interest, whatever their state."""
+        return self.width * self.height - self.count_cells(CellState.NO_INTEREST)
+
+    @property
+    def coverage(self) -> float:
+        """Fraction of the AoI scanned so far."""
+        total = self.aoi_count
+        return self.scanned_count / total if total else 1.0
+
+    def cells_with_state(self, state: CellState):
+        """Coordinates (xs, ys) of every cell in the given state."""
+        return np.nonzero(self.states == state.value)
+
+    def is_scan_complete(self):
+        """Whether every cell of the AoI has been scanned."""
+        return self.state_counts[CellState.NOT_SCANNED.value] == 0
+
+    def update_cluster(self, method=None, n_clusters=None):
+        """Refresh the clusters; method and n_clusters default to the map's."""
+        method = method or self.cluster_method
+        n_clusters = n_clusters or self.n_clusters
+        self.cluster_calls += 1
+        with Profiler().section("clustering"):
+            self._update_cluster(method, n_clusters)
+
+    def _update_cluster(self, method, n_clusters):
         if method == "dbscan":
-            clusters = self.apply_dbscan(remainAoI)
-        elif method == "kmeans":
-            clusters = self.apply_kmeans(remainAoI, n_clusters)
-        else:
-            self.updating_cluster = False
+            # Incremental component labelling is cheap enough to run inline.
+            # Its clusters are updated in place, so they aren't cached; a call
+            # with nothing changed since the last one counts as a hit
+            if self._labeler().dirty:
+                self.cluster_cache_misses += 1
+            else:
+                self.cluster_cache_hits += 1
+            self._set_clusters(self.grid_clusters(), labelled=True)
+            return
+
+        key = (self.aoi_fingerprint, method, n_clusters)
+        cached = self._cluster_cache.get(key)
+        if cached is not None:
+            self._cluster_cache.move_to_end(key)
+            self.cluster_cache_hits += 1
+            self._set_clusters(cached)
+            # Anything still in flight is older than this answer
+            self._applied_generation = self.cluster_generation
+            return
+        self.cluster_cache_misses += 1
+
+        if key == self._cluster_request:
             return
+        self._cluster_request = key
 
-        # Updating clusters safely after computation
+        remainAoI = self.remaining_aoi()
+        if not len(remainAoI):
+            return
+
+        # Jobs still queued are superseded by this snapshot
+        for _, _, job in self._cluster_jobs:
+            job.cancel()
+
+        self.cluster_generation += 1
+        job = self.executor.submit(
+            cluster_job, remainAoI, self.cell_size, method, n_clusters
+        )
+        self._cluster_jobs.append((self.cluster_generation, key, job))
+        job.add_done_callback(partial(self._cluster_job_done, key))
+
+    def _cluster_job_done(self, key, job):
+        """
+        Runs when a clustering job ends, possibly on the executor's thread.
+        A job that failed or was cancelled leaves nothing in the cache, so
+        the same AoI has to be submitted again the next time it's asked for.
+        """
+        if not job.cancelled():
+            if job.exception() is None:
+                return
+            print(f"Error clustering AoI: {job.exception()}")
+        if self._cluster_request == key:
+            self._cluster_request = None
+
+    def _set_clusters(self, clusters, labelled: bool = False):
+        """
+        Apply a clustering and index its cells for the remaining counters.
+        Clusters from grid_clusters() are labelled: their cells are already
+        indexed by the component labels and kept counted there.
+        """
         self.clusters = clusters
-        self.updating_cluster = False
+        if labelled or not clusters:
+            self.cluster_slots = None
+            self._slot_clusters = []
+            return
+        if clusters == self._slot_clusters:
+            return
 
-    def apply_dbscan(self, AoI, eps=1.0, min_samples=1) -> list[Cluster]:
-        coordinates = np.array([list(cell) for cell in AoI])
-        dbscan = DBSCAN(eps=eps, min_samples=min_samples)
-        dbscan.fit(coordinates)
-        clusters = []
-        for label in set(dbscan.labels_):
-            if label == -1:
+        dtype = np.min_scalar_type(len(clusters))
+        if self.cluster_slots is None or self.cluster_slots.dtype != dtype:
+            self.cluster_slots = self._new_grid(dtype, 0)
+        else:
+            for cluster in self._slot_clusters:
+                if cluster.cells is not None:
+                    self.cluster_slots[cluster.cells[:, 0], cluster.cells[:, 1]] = 0
+        self._slot_clusters = list(clusters)
+        for slot, cluster in enumerate(clusters, 1):
+            if cluster.cells is None:
+                continue
+            xs, ys = cluster.cells[:, 0], cluster.cells[:, 1]
+            remaining = self.values[xs, ys] > 0
+            self.cluster_slots[xs[remaining], ys[remaining]] = slot
+            cluster.remaining = int(remaining.sum())
+
+    def _leave_clusters(self, xs, ys):
+        """Count cells leaving the AoI off the clusters that hold them."""
+        if not len(xs):
+            return
+        if self.cluster_slots is not None:
+            slots = self.cluster_slots[xs, ys]
+            held = slots > 0
+            self.cluster_slots[xs[held], ys[held]] = 0
+            clusters = dict(enumerate(self._slot_clusters, 1))
+        elif self._grid_clusters:
+            slots = self._grid_clustering.labels[xs, ys]
+            held = slots >= 0
+            clusters = self._grid_clusters
+        else:
+            return
+        for slot, count in zip(*np.unique(slots[held], return_counts=True)):
+            # Pieces split off since the last grid_clusters() have no
+            # cluster yet; theirs will be counted when it's built
+            cluster = clusters.get(int(slot))
+            if cluster is not None:
+                cluster.remaining -= int(count)
+
+    def clusters_holding(self, cells) -> list[Cluster]:
+        """
+        Applied clusters that still hold any of the given (n, 2) cells, e.g.
+        the parts of an older cluster that a reclustering split or relabelled.
+        """
+        if cells is None or not len(cells):
+            return []
+        cells = np.asarray(cells)
+        xs, ys = cells[:, 0], cells[:, 1]
+        if self.cluster_slots is not None:
+            slots = np.unique(self.cluster_slots[xs, ys])
+            return [self._slot_clusters[slot - 1] for slot in slots.tolist() if slot]
+        if not self._grid_clusters:
+            return []
+        labels = np.unique(self._grid_clustering.labels[xs, ys]).tolist()
+        return [
+            self._grid_clusters[label]
+            for label in labels
+            if label in self._grid_clusters
+        ]
+
+    def first_scan_ticks(self, xs, ys):
+        """
+        Tick at which each cell (xs[i], ys[i]) was first scanned, or -1 if it
+        never was. Ticks over 65534 past the last grid rebuild read as that.
+        """
+        ticks = self.scan_ticks[xs, ys].astype(np.int64)
+        return np.where(ticks > 0, ticks - 1 + self._scan_tick_base, -1)
+
+    def _cache_clusters(self, key, clusters):
+        self._cluster_cache[key] = clusters
+        self._cluster_cache.move_to_end(key)
+        while len(self._cluster_cache) > self.cluster_cache_size:
+            self._cluster_cache.popitem(last=False)
+
+    @property
+    def updating_cluster(self):
+        return any(not job.done() for _, _, job in self._cluster_jobs)
+
+    def poll_clusters(self, wait=False):
+        """
+        Collect finished clustering jobs. A result is applied only if it is
+        newer than the clusters already applied; older ones are discarded.
+
+        Args:
+            wait (bool): Block until every submitted job has finished.
+        """
+        if wait:
+            futures.wait([job for _, _, job in self._cluster_jobs])
+
+        running = []
+        for generation, key, job in self._cluster_jobs:
+            if not job.done():
+                running.append((generation, key, job))
                 continue
-            cluster_points = coordinates[dbscan.labels_ == label]
-            centroid = np.mean(cluster_points, axis=0) * self.cell_size
-            distances = np.linalg.norm(cluster_points - centroid, axis=1)
-            radius = np.max(distances) * self.cell_size
-
-            clusters.append(
-                Cluster(
-                    centroid=centroid,
-                    radius=radius,
-                    important_score=len(cluster_points),
+            # Failures were logged by _cluster_job_done
+            if job.cancelled() or job.exception() is not None:
+                continue
+            self._cache_clusters(key, job.result())
+            if key == self._cluster_request:
+                # Answered by the cache from now on, for as long as it's kept
+                self._cluster_request = None
+            if generation > self._applied_generation:
+                self._set_clusters(job.result())
+                self._applied_generation = generation
+        self._cluster_jobs = running
+
+    @property
+    def executor(self):
+        if self._executor is None:
+            self._executor = shared_cluster_executor()
+        return self._executor
+
+    def _labeler(self) -> GridClustering:
+        if self._grid_clustering is None:
+            self._grid_clustering = GridClustering(self.values > 0)
+        return self._grid_clustering
+
+    def remaining_aoi(self):
+        """Cells still in the AoI as an (n, 2) array, from the grid labeler."""
+        return self._labeler().coordinates()
+
+    def grid_clusters(self) -> list[Cluster]:
+        """
+        DBSCAN(eps=1, min_samples=1) clusters of the remaining AoI, read from
+        incrementally maintained grid components. Only components touched
+        since the previous call are visited: new ones get a Cluster, ones
+        that only shrank keep theirs with the centroid and remaining count
+        moved along (cells and radius stay as first built).
+        """
+        labeler = self._labeler()
+        labeler.flush()
+        for label in labeler.drain_changed():
+            cluster = self._grid_clusters.get(label)
+            if label not in labeler.components:
+                self._grid_clusters.pop(label, None)
+            elif cluster is None:
+                cx, cy = labeler.cells(label)
+                self._grid_clusters[label] = make_cluster(
+                    np.column_stack((cx, cy)), self.cell_size
                 )
-            )
-        return clusters
+            else:
+                count = labeler.counts[label]
+                cluster.centroid = labeler.sums[label] / count * self.cell_size
+                cluster.remaining = count
+        return [self._grid_clusters[label] for label in sorted(self._grid_clusters)]
+
+    def apply_dbscan(self, AoI, eps=1.0, min_samples=1) -> list[Cluster]:
+        return dbscan_clusters(AoI, self.cell_size, eps, min_samples)
 
     def apply_kmeans(self, AoI, n_clusters=3) -> list[Cluster]:
-        coordinates = np.array([list(cell) for cell in AoI])
-        if len(coordinates) < n_clusters:
-            n_clusters = len(coordinates)
-        kmeans = KMeans(n_clusters=n_clusters, n_init=10)
-        labels = kmeans.fit_predict(coordinates)
-        clusters = {}
-        for label in set(labels):
-            cluster_points = coordinates[labels == label]
-            centroid = np.mean(cluster_points, axis=0) * self.cell_size
-            distances = np.linalg.norm(cluster_points - centroid, axis=1)
-            radius = np.max(distances) * self.cell_size
-
-            clusters.append(
-                Cluster(
-                    centroid=centroid,
-                    radius=radius,
-                    important_score=len(cluster_points),
-                )
-            )
-        return clusters
+        return kmeans_clusters(AoI, self.cell_size, n_clusters)
 
     def update(self):
-        """Update all cells."""
-        for cell in self.cells.values():
-            cell.update()
+        """Advance the map's tick and update all clusters."""
+        self.tick += 1
+        self.poll_clusters()
 
         for cluster in self.clusters:
             cluster.update()
 
     def handle_events(self):
-        """Handle events for all cells."""
-        for cell in self.cells.values():
-            cell.handle_events()
-
+        """Handle events for all clusters."""
         for cluster in self.clusters:
             cluster.handle_events()
 
     def draw(self):
-        for cell in self.cells.values():
-            cell.draw()
+        from .Game import Game
+        from .MapLayer import MapLayer
+
+        if self._layer is None:
+            self._layer = MapLayer(self)
+        self._layer.draw(Game().getWindow())
 
         for cluster in self.clusters:
             cluster.draw()
@@ -152,7 +818,7 @@ class GroundMap:
         """Update the map state with new parameters."""
         if new_points is not None:
             self.AoI = new_points
-            self._rebuild_cells()
+            self._build_grid()
 
         if new_wind_direction is not None:
             self.wind_direction = new_wind_direction
@@ -160,40 +826,12 @@ class GroundMap:
         if new_wind_strength is not None:
             self.wind_strength = new_wind_strength
 
-    def _rebuild_cells(self):
-        """Rebuild cells based on updated AoI or screen size."""
-        self.cells.clear()  # Clear existing cells
-
-        # Recalculate cell size based on the window size
-        self.cell_size_x = self.window_width // self.width
-        # New cell size based on map width
-        self.cell_size_y = self.window_height // self.height
-        # New cell size based on map height
-
-        # Choose the smaller of the two to ensure cells fit in both directions
-        self.cell_size = min(self.cell_size_x, self.cell_size_y)
-
-        # Recreate the grid with updated cell size
-        for x in range(0, self.width):
-            for y in range(0, self.height):
-                rect = Rect(
-                    x * self.cell_size,
-                    y * self.cell_size,
-                    self.cell_size,
-                    self.cell_size,
-                )
-
-                # Determine cell value and state based on AoI
-                cell_value = 0
-                cell_state = CellState.NO_INTEREST
-                if (x, y) in self.AoI:
-                    cell_value = 1
-                    cell_state = CellState.NOT_SCANNED
-
-                # Create and store the cell
-                cell = Cell(rect, cell_value, cell_state)
-                self.cells[(x, y)] = cell
-
     def clean(self):
-        self.cells.clear()
-        self.clusters.clear()
+        for _, _, job in self._cluster_jobs:
+            job.cancel()
+        self._cluster_jobs = []
+        self._cluster_cache.clear()
+        self._set_clusters([])
+        if self._layer is not None:
+            self._layer.clean()
+            self._layer = None
@@ -0,0 +1,79 @@
+import time
+from .Game import Game
+
+
+class HeadlessRunner:
+    """Step a mission with no display, no frame cap and no rendering."""
+
+    def __init__(self, state_factory=None, max_ticks: int = 100_000):
+        """
+        Args:
+            state_factory (callable): Builds the mission state (defaults to DemoState).
+            max_ticks (int): Give up after this many simulation ticks.
+        """
+        if state_factory is None:
+            from .DemoState import DemoState
+
+            state_factory = DemoState
+
+        self.state_factory = state_factory
+        self.max_ticks = max_ticks
+
+    def run(self):
+        """
+        Run the mission until every AoI cell is scanned or max_ticks is reached.
+
+        Returns:
+            dict: ticks, completed, wall_time, ticks_per_second, completion_time,
+                coverage_time (simulated seconds), distance_flown,
+                clustering_calls and clustering_runs (calls not served from
+                the cache).
+        """
+        game = Game(headless=True)
+        state = self.state_factory()
+
+        ticks = 0
+        completed = False
+        start = time.perf_counter()
+        while ticks < self.max_ticks:
+            state.update()
+            state.handle_events()
+            ticks += 1
+            if state.ground_map.is_scan_complete():
+                completed = True
+                break
+        wall_time = time.perf_counter() - start
+        kinematics = state.swarm_manager.kinematics
+        distance_flown = float(kinematics.distances[: kinematics.count].sum())
+        ground_map = state.ground_map
+        clustering_calls = ground_map.cluster_calls
+        clustering_runs = ground_map.cluster_cache_misses
+        state.clean()
+
+        return {
+            "ticks": ticks,
+            "completed": completed,
+            "wall_time": wall_time,
+            "ticks_per_second": ticks / wall_time if wall_time > 0 else 0.0,
+            "completion_time": wall_time if completed else None,
+            "coverage_time": ticks * game.step_time if completed else None,
+            "distance_flown": distance_flown,
+            "clustering_calls": clustering_calls,
+            "clustering_runs": clustering_runs,
+        }
+
+    @staticmethod
+    def format_report(result):
+        """Human readable summary of a run() result."""
+        lines = [
+            f"ticks: {result['ticks']}",
+            f"ticks/s: {result['ticks_per_second']:.1f}",
+        ]
+        if result["completed"]:
+            lines.append(
+                f"mission completed in {result['completion_time']:.2f}s "
+                f"({result['ticks']} ticks)"
+            )
+        else:
+            lines.append(f"mission not completed after {result['ticks']} ticks")
+        return "\n".join(lines)
@@ -0,0 +1,98 @@
+import numpy as np
+from .engine.SpatialGrid import SpatialGrid
+
+
+class Kinematics:
+    """Fleet-wide motion state kept in contiguous arrays, one row per UAV."""
+
+    def __init__(self, separation_distance: float = 50, capacity: int = 16):
+        self.separation_distance = separation_distance
+        self.count = 0
+        self.positions = np.zeros((capacity, 2))
+        self.forces = np.zeros((capacity, 2))
+        # Cell targets override the swarm centroid as the point of attraction
+        self.targets = np.zeros((capacity, 2))
+        self.has_target = np.zeros(capacity, dtype=bool)
+        self.swarm_ids = np.zeros(capacity, dtype=np.int64)
+        # Distance each UAV has flown so far
+        self.distances = np.zeros(capacity)
+        # Neighbour buckets, rebuilt from the positions at every step
+        self.grid = SpatialGrid(separation_distance)
+
+    def add(self, pos, swarm_id: int) -> int:
+        """Register a UAV and return its row index."""
+        if self.count == len(self.positions):
+            self._grow(2 * len(self.positions))
+
+        index = self.count
+        self.positions[index] = pos
+        self.forces[index] = 0.0
+        self.has_target[index] = False
+        self.swarm_ids[index] = swarm_id
+        self.distances[index] = 0.0
+        self.count += 1
+        return index
+
+    def _grow(self, capacity: int):
+        for name in (
+            "positions",
+            "forces",
+            "targets",
+            "has_target",
+            "swarm_ids",
+            "distances",
+        ):
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[: self.count] = old[: self.count]
+            setattr(self, name, new)
+
+    def set_target(self, index: int, target):
+        if target is None:
+            self.has_target[index] = False
+        else:
+            self.targets[index] = target
+            self.has_target[index] = True
+
+    def separation(self, positions, swarm_ids):
+        """
+        Sum of (p_i - p_j) over UAVs j of the same swarm closer than
+        separation_distance, found through the uniform neighbour grid.
+        """
+        self.grid.build(positions)
+        i, j = self.grid.pairs(self.separation_distance)
+        same = swarm_ids[i] == swarm_ids[j]
+        i, j = i[same], j[same]
+
+        n = len(positions)
+        diff = positions[i] - positions[j]
+        result = np.empty((n, 2))
+        result[:, 0] = np.bincount(i, weights=diff[:, 0], minlength=n)
+        result[:, 1] = np.bincount(i, weights=diff[:, 1], minlength=n)
+        return result
+
+    def step(self, centroids, steps):
+        """
+        Advance every UAV by one batched kinematics step.
+
+        Args:
+            centroids (np.ndarray): (n_swarm_ids, 2) swarm centroids by swarm id.
+            steps (np.ndarray): Unit steps to take this tick, by swarm id.
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        positions = self.positions[:n]
+        swarm_ids = self.swarm_ids[:n]
+        goals = np.where(self.has_target[:n, None], self.targets[:n], centroids[swarm_ids])
+
+        forces = goals - positions + self.separation(positions, swarm_ids)
+        magnitude = np.hypot(forces[:, 0], forces[:, 1])
+        moving = magnitude > 0
+        forces[moving] /= magnitude[moving, None]
+
+        self.forces[:n] = forces
+        moves = forces * steps[swarm_ids, None]
+        positions += moves
+        self.distances[:n] += np.hypot(moves[:, 0], moves[:, 1])
@@ -0,0 +1,118 @@
+import math
+import numpy as np
+import pygame
+from .Cell import Cell, CellState
+from .engine.TextManager import TextManager
+from .engine.Window import Window
+
+
+class MapLayer:
+    """
+    Off-screen picture of a GroundMap. The whole grid is painted once; after
+    that only cells the map reports as changed are repainted.
+    """
+
+    BORDER = 1
+    BORDER_COLOR = "white"
+    # Cells smaller than this (in pixels) are drawn without their value
+    MIN_TEXT_CELL = 12
+
+    def __init__(self, ground_map):
+        self.ground_map = ground_map
+        self.changes = ground_map.track_changes()
+        self.surface = None
+        self.zoom = None
+        self.scale = None
+        self.visible = (0, 0)
+        self.colors = np.zeros((len(CellState), 3), dtype=np.uint8)
+        for state, color in Cell.state_colors.items():
+            self.colors[state.value] = pygame.Color(color)[:3]
+
+    def draw(self, window: Window):
+        if self.surface is None or self.changes.reset or self.zoom != window.zoom_factor:
+            self.changes.drain()
+            self._paint_all(window)
+            changed = None
+        else:
+            xs, ys = self.changes.drain()
+            changed = self._paint_cells(window, xs, ys)
+        window.blit_static(self.surface, (0, 0), changed)
+
+    def _cell_span(self, index):
+        """First and one-past-last pixel of a cell along one axis."""
+        return math.ceil(index * self.scale), math.ceil((index + 1) * self.scale)
+
+    def _paint_all(self, window: Window):
+        ground_map = self.ground_map
+        self.zoom = window.zoom_factor
+        self.scale = ground_map.cell_size * self.zoom
+        # Only the part of the map that fits in the window is kept
+        width = min(math.ceil(ground_map.width * self.scale), window.width)
+        height = min(math.ceil(ground_map.height * self.scale), window.height)
+        self.surface = pygame.Surface((max(width, 1), max(height, 1)))
+
+        px_cells, px_border = self._pixel_cells(width, ground_map.width)
+        py_cells, py_border = self._pixel_cells(height, ground_map.height)
+        self.visible = (
+            int(px_cells[-1]) + 1 if width else 0,
+            int(py_cells[-1]) + 1 if height else 0,
+        )
+        if not width or not height:
+            return
+
+        states = ground_map.states[px_cells[:, None], py_cells[None, :]]
+        pixels = self.colors[states]
+        pixels[px_border[:, None] | py_border[None, :]] = pygame.Color(
+            self.BORDER_COLOR
+        )[:3]
+        pygame.surfarray.blit_array(self.surface, pixels)
+
+        if self.scale >= self.MIN_TEXT_CELL:
+            for x in range(self.visible[0]):
+                for y in range(self.visible[1]):
+                    self._paint_value(window, x, y)
+
+    def _pixel_cells(self, pixels, cells):
+        """Cell index under every pixel along an axis, and which pixels are border."""
+        px = np.arange(pixels)
+        index = np.minimum(np.floor(px / self.scale).astype(np.int64), cells - 1)
+        start = np.ceil(index * self.scale)
+        stop = np.ceil((index + 1) * self.scale)
+        border_width = max(int(self.BORDER * self.zoom), 1)
+        border = (px - start < border_width) | (stop - 1 - px < border_width)
+        return index, border
+
+    def _paint_cells(self, window: Window, xs, ys):
+        """Repaint the given cells and return the rects that changed."""
+        changed = []
+        visible = (xs < self.visible[0]) & (ys < self.visible[1])
+        for x, y in zip(xs[visible].tolist(), ys[visible].tolist()):
+            x0, x1 = self._cell_span(x)
+            y0, y1 = self._cell_span(y)
+            rect = pygame.Rect(x0, y0, x1 - x0, y1 - y0)
+            state = self.ground_map.states[x, y]
+            pygame.draw.rect(self.surface, self.colors[state], rect)
+            pygame.draw.rect(
+                self.surface,
+                self.BORDER_COLOR,
+                rect,
+                width=max(int(self.BORDER * self.zoom), 1),
+            )
+            if self.scale >= self.MIN_TEXT_CELL:
+                self._paint_value(window, x, y)
+            changed.append(rect)
+        return changed
+
+    def _paint_value(self, window: Window, x, y):
+        x0, x1 = self._cell_span(x)
+        y0, y1 = self._cell_span(y)
+        TextManager().print(
+            window,
+            str(self.ground_map.values[x, y]),
+            ((x0 + x1) // 2, (y0 + y1) // 2),
+            surface=self.surface,
+        )
+
+    def clean(self):
+        self.ground_map.untrack_changes(self.changes)
+        self.surface = None
@@ -7,18 +7,29 @@ class MenuState(GameState):
     def __init__(self):
         self.buttons = []
         from .DemoState import DemoState
+        from .Game import Game
 
         button = Button(x=450, y=300, width=300, height=100)
         button.set_title("Start Demo")
         button.set_border(2)
         button.set_font_size(40)
-        button.on_click(lambda: GameStateManager().push_state(DemoState()))
+        button.on_click(
+            lambda: GameStateManager().push_state(
+                DemoState(
+                    record_path=Game().record_path,
+                    scenario_path=Game().scenario_path,
+                )
+            )
+        )
         self.buttons.append(button)
 
-    def update(self):
+    def handle_input(self):
         for button in self.buttons:
             button.update()
 
+    def update(self):
+        pass
+
     def handle_events(self):
         pass
 
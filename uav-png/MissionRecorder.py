@@ -0,0 +1,214 @@
+import os
+import numpy as np
+
+MAGIC = b"UAVREC01"
+VERSION = 2
+
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("uav_count", "<u4"),
+        ("width", "<u4"),
+        ("height", "<u4"),
+        ("cell_size", "<u4"),
+        ("chunked", "u1"),
+        ("tile_size", "<u4"),
+        # Cells of the initial grid that follow the header
+        ("initial_count", "<u8"),
+    ]
+)
+
+# One record per changed cell, appended to the sibling ".cells" file; the
+# initial grid is stored the same way
+DELTA_DTYPE = np.dtype(
+    [
+        ("tick", "<u4"),
+        ("x", "<u4"),
+        ("y", "<u4"),
+        ("state", "u1"),
+        ("value", "u1"),
+    ]
+)
+
+
+def frame_dtype(uav_count: int) -> np.dtype:
+    """Fixed-size per-tick record for a fleet of uav_count UAVs."""
+    return np.dtype(
+        [
+            ("tick", "<u4"),
+            # Number of cell deltas written up to and including this tick
+            ("delta_end", "<u8"),
+            # Set when the grid was rebuilt: this tick's deltas are then every
+            # non-blank cell, and cells not among them are blank
+            ("reset", "u1"),
+            ("positions", "<f4", (uav_count, 2)),
+            ("swarm_ids", "<i4", (uav_count,)),
+        ]
+    )
+
+
+def deltas_path(path) -> str:
+    return f"{path}.cells"
+
+
+class MissionRecorder:
+    """
+    Append a mission to a compact binary recording, one fixed-size frame per
+    tick. The main file holds a header, the initial grid (only the cells
+    that differ from a blank map, so chunked maps stay sparse) and the
+    frames; changed cells go to ``<path>.cells`` so frames stay fixed-size
+    and can be memory-mapped.
+    """
+
+    def __init__(self, path, swarm_manager, ground_map):
+        """
+        Args:
+            path (str): Recording to create; an existing file is overwritten.
+            swarm_manager (SwarmManager): Fleet to record; its size is fixed.
+            ground_map (GroundMap): Map whose cell changes are recorded.
+        """
+        self.path = str(path)
+        self.swarm_manager = swarm_manager
+        self.ground_map = ground_map
+        self.uav_count = swarm_manager.kinematics.count
+        self.frame_dtype = frame_dtype(self.uav_count)
+        self.tick = 0
+        self.delta_count = 0
+
+        self._file = open(self.path, "wb")
+        self._deltas = open(deltas_path(self.path), "wb")
+        header = np.zeros(1, dtype=HEADER_DTYPE)
+        header["magic"] = MAGIC
+        header["version"] = VERSION
+        header["uav_count"] = self.uav_count
+        header["width"] = ground_map.width
+        header["height"] = ground_map.height
+        header["cell_size"] = ground_map.cell_size
+        header["chunked"] = ground_map.chunked
+        header["tile_size"] = ground_map.tile_size
+        initial = self._cells(*ground_map.occupied_cells())
+        header["initial_count"] = len(initial)
+        self._file.write(header.tobytes())
+        self._file.write(initial.tobytes())
+        # Start from a clean log: the initial grid is already written
+        self.changes = ground_map.track_changes()
+        self.changes.drain()
+
+    def record(self):
+        """Append the current tick: fleet positions, membership and cell deltas."""
+        kinematics = self.swarm_manager.kinematics
+        if kinematics.count != self.uav_count:
+            raise ValueError(
+                f"Fleet size changed from {self.uav_count} to {kinematics.count}"
+            )
+
+        reset = self.changes.reset
+        if reset:
+            # The grid was rebuilt: record it whole, but only non-blank cells
+            self.changes.drain()
+            xs, ys = self.ground_map.occupied_cells()
+        else:
+            xs, ys = self.changes.drain()
+        if len(xs):
+            deltas = self._cells(xs, ys)
+            self._deltas.write(deltas.tobytes())
+            self.delta_count += len(xs)
+
+        frame = np.zeros(1, dtype=self.frame_dtype)
+        frame["tick"] = self.tick
+        frame["delta_end"] = self.delta_count
+        frame["reset"] = reset
+        frame["positions"] = kinematics.positions[: self.uav_count]
+        frame["swarm_ids"] = kinematics.swarm_ids[: self.uav_count]
+        self._file.write(frame.tobytes())
+        self.tick += 1
+
+    def _cells(self, xs, ys):
+        """DELTA_DTYPE records of the current state and value of cells."""
+        cells = np.zeros(len(xs), dtype=DELTA_DTYPE)
+        cells["tick"] = self.tick
+        cells["x"] = xs
+        cells["y"] = ys
+        cells["state"] = self.ground_map.states[xs, ys]
+        cells["value"] = self.ground_map.values[xs, ys]
+        return cells
+
+    def close(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._deltas.close()
+        self._file = None
+        self._deltas = None
+        self.ground_map.untrack_changes(self.changes)
+
+
+class MissionRecording:
+    """Read-only, memory-mapped view of a file written by MissionRecorder."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.header = np.fromfile(self.path, dtype=HEADER_DTYPE, count=1)
+        if len(self.header) == 0 or self.header["magic"][0] != MAGIC:
+            raise ValueError(f"{self.path} is not a mission recording")
+        if self.header["version"][0] != VERSION:
+            raise ValueError(
+                f"Unsupported recording version {self.header['version'][0]}"
+            )
+
+        self.uav_count = int(self.header["uav_count"][0])
+        self.width = int(self.header["width"][0])
+        self.height = int(self.header["height"][0])
+        self.cell_size = int(self.header["cell_size"][0])
+        self.chunked = bool(self.header["chunked"][0])
+        self.tile_size = int(self.header["tile_size"][0])
+
+        offset = HEADER_DTYPE.itemsize
+        initial_count = int(self.header["initial_count"][0])
+        self.initial_cells = self._map(self.path, DELTA_DTYPE, offset, initial_count)
+
+        offset += initial_count * DELTA_DTYPE.itemsize
+        dtype = frame_dtype(self.uav_count)
+        # A recording cut short may end in a partial frame; ignore it
+        frame_count = (self._size(self.path) - offset) // dtype.itemsize
+        self.frames = self._map(self.path, dtype, offset, frame_count)
+        delta_count = self._size(deltas_path(self.path)) // DELTA_DTYPE.itemsize
+        if frame_count:
+            delta_count = min(delta_count, int(self.frames["delta_end"][-1]))
+        self.deltas = self._map(deltas_path(self.path), DELTA_DTYPE, 0, delta_count)
+        self.reset_ticks = np.flatnonzero(self.frames["reset"])
+
+    @staticmethod
+    def _size(path):
+        return os.path.getsize(path) if os.path.exists(path) else 0
+
+    @staticmethod
+    def _map(path, dtype, offset, count):
+        # np.memmap refuses empty maps
+        if count == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+    def __len__(self):
+        return len(self.frames)
+
+    def frame(self, tick: int):
+        return self.frames[tick]
+
+    def delta_range(self, start_tick: int, stop_tick: int):
+        """Deltas recorded after start_tick up to and including stop_tick."""
+        start = 0 if start_tick < 0 else int(self.frames["delta_end"][start_tick])
+        stop = int(self.frames["delta_end"][stop_tick])
+        return self.deltas[start:stop]
+
+    def last_reset(self, tick: int) -> int:
+        """Latest tick up to tick at which the grid was rebuilt, or -1."""
+        index = np.searchsorted(self.reset_ticks, tick, side="right")
+        return int(self.reset_ticks[index - 1]) if index else -1
+
+    def grid_cells(self, reset_tick: int):
+        """Every non-blank cell of the grid as rebuilt at reset_tick (-1: start)."""
+        if reset_tick < 0:
+            return self.initial_cells
+        return self.delta_range(reset_tick - 1, reset_tick)
@@ -0,0 +1,165 @@
+import numpy as np
+import pygame
+from .engine.GameState import GameState
+from .engine.GameStateManager import GameStateManager
+from .engine.InputManager import InputManager
+from .engine.TextManager import TextManager
+from .engine.TextureManager import TextureManager
+from .Cell import CellState
+from .GroundMap import GroundMap
+from .MissionRecorder import MissionRecording
+from .Uav import _marker_sprite
+
+
+class ReplayState(GameState):
+    """
+    Play back a MissionRecording. Nothing is simulated: every tick is read
+    from the memory-mapped file, so any tick can be reached instantly.
+
+    Keys: SPACE play/pause, LEFT/RIGHT step one tick (100 with SHIFT),
+    HOME/END jump to the first/last tick, '+'/'-'/'0' playback speed.
+    """
+
+    UAV_SIZE = 30
+    SEEK_STEP = 100
+
+    def __init__(self, path):
+        self.recording = MissionRecording(path)
+        self.ground_map = GroundMap(
+            AoI=[],
+            width=self.recording.width,
+            height=self.recording.height,
+            wind_direction=[0.0, 0.0],
+            wind_strength=0,
+            cell_size=self.recording.cell_size,
+            chunked=self.recording.chunked,
+            tile_size=self.recording.tile_size,
+        )
+        self.tick = -1  # Last tick whose deltas are applied to the map
+        self._load_grid(-1)
+        self.playing = True
+        self.seek(0)
+
+    def seek(self, tick: int):
+        """Show the mission as it was at the end of the given tick."""
+        if len(self.recording) == 0:
+            return
+        tick = min(max(int(tick), 0), len(self.recording) - 1)
+        reset = self.recording.last_reset(tick)
+        if tick < self.tick or reset > self.tick:
+            # Rewinding, or the grid was rebuilt on the way: start over from
+            # the latest full grid
+            self._load_grid(reset)
+        if tick > self.tick:
+            self._apply(self.recording.delta_range(self.tick, tick))
+        self.tick = tick
+
+    def _load_grid(self, reset_tick: int):
+        """Show the grid as stored at reset_tick (-1: the initial grid)."""
+        cells = self.recording.grid_cells(reset_tick)
+        self.ground_map.set_grid(cells["x"], cells["y"], cells["state"], cells["value"])
+        self.tick = reset_tick
+
+    def _apply(self, deltas):
+        """Write the last recorded state and value of every touched cell."""
+        if len(deltas) == 0:
+            return
+        flat = deltas["x"].astype(np.int64) * self.recording.height + deltas["y"]
+        # Reversed, np.unique's first occurrence is the latest delta per cell
+        _, last = np.unique(flat[::-1], return_index=True)
+        latest = deltas[len(deltas) - 1 - last]
+        xs = latest["x"].astype(np.int64)
+        ys = latest["y"].astype(np.int64)
+        # Group by (state, value); a handful of combinations at most
+        keys = latest["state"].astype(np.int64) * 256 + latest["value"]
+        for key in np.unique(keys).tolist():
+            group = keys == key
+            state, value = divmod(key, 256)
+            self.ground_map.set_values(xs[group], ys[group], value)
+            self.ground_map.set_states(xs[group], ys[group], CellState(state))
+
+    def handle_input(self):
+        from .Game import Game
+
+        manager = InputManager()
+        if manager.is_key_down(pygame.K_ESCAPE):
+            GameStateManager().pop_state()
+            return
+        if manager.is_key_down(pygame.K_SPACE):
+            self.playing = not self.playing
+
+        step = 1
+        if manager.is_key_held(pygame.K_LSHIFT) or manager.is_key_held(pygame.K_RSHIFT):
+            step = self.SEEK_STEP
+        if manager.is_key_down(pygame.K_RIGHT):
+            self.seek(self.tick + step)
+        if manager.is_key_down(pygame.K_LEFT):
+            self.seek(self.tick - step)
+        if manager.is_key_down(pygame.K_HOME):
+            self.seek(0)
+        if manager.is_key_down(pygame.K_END):
+            self.seek(len(self.recording) - 1)
+        Game().handle_time_warp_input()
+
+    def update(self):
+        if not self.playing:
+            return
+        if self.tick >= len(self.recording) - 1:
+            self.playing = False
+            return
+        self.seek(self.tick + 1)
+
+    def handle_events(self):
+        pass
+
+    def render(self):
+        from .Game import Game
+
+        window = Game().getWindow()
+        self.ground_map.draw()
+        if len(self.recording):
+            self._draw_fleet(window, self.recording.frame(self.tick))
+
+        status = "playing" if self.playing else "paused"
+        TextManager().print(
+            window,
+            f"tick {self.tick + 1}/{len(self.recording)} {status} "
+            f"x{Game().time_warp:g}",
+            (window.width // 2, 20),
+            color="black",
+        )
+
+    def _draw_fleet(self, window, frame):
+        """UAV sprites plus one centroid marker per recorded swarm."""
+        positions = np.asarray(frame["positions"], dtype=float)
+        swarm_ids = np.asarray(frame["swarm_ids"])
+        zoom = window.zoom_factor
+        blits = []
+        texture = TextureManager().get_transformed(
+            "uav", (self.UAV_SIZE, self.UAV_SIZE), 0, zoom
+        )
+        if texture is not None:
+            corners = positions - self.UAV_SIZE // 2
+            blits.extend((texture, (x, y)) for x, y in corners.tolist())
+        marker = _marker_sprite(3, "green", zoom)
+        offset = marker.get_width() // 2
+        for x, y in (positions * zoom).astype(int).tolist():
+            blits.append((marker, (x - offset, y - offset)))
+        window.blits(blits)
+
+        _, members = np.unique(swarm_ids, return_inverse=True)
+        counts = np.bincount(members)
+        centroids = np.column_stack(
+            (
+                np.bincount(members, positions[:, 0]) / counts,
+                np.bincount(members, positions[:, 1]) / counts,
+            )
+        )
+        for centroid in centroids:
+            window.draw_circle(centroid, 5, "blue")
+
+    def clean(self):
+        self.ground_map.clean()
+        self.ground_map = None
+        self.recording = None
+
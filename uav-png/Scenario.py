@@ -0,0 +1,116 @@
+import csv
+import json
+import os
+import numpy as np
+from .GroundMap import GroundMap
+from .Uav import Uav
+
+# Fleet table columns; x and y become the UAV's starting position
+FLEET_COLUMNS = (
+    "x",
+    "y",
+    "remain_energy",
+    "min_speed",
+    "max_speed",
+    "buffer_data",
+    "size",
+    "connection_range",
+)
+
+
+def _number(value):
+    """CSV cells arrive as text; keep whole numbers as ints like the demo."""
+    if not isinstance(value, str):
+        return value
+    number = float(value)
+    return int(number) if number.is_integer() else number
+
+
+class Scenario:
+    """
+    A mission described by a JSON file instead of code:
+
+        {
+            "map": {"width": 30, "height": 20, "cell_size": null,
+                    "wind_direction": [0.5, 0.5], "wind_strength": 10,
+                    "chunked": false, "cluster_method": "dbscan"},
+            "aoi": [[20, 8], ...]  or  "aoi_mask": "area.npy",
+            "fleet": [{"x": 150, "y": 300, ...}, ...]  or  "fleet": "fleet.csv"
+        }
+
+    Masks are images or .npy arrays laid out like an image, (height, width);
+    .npy masks are memory-mapped and any nonzero cell is AoI, image masks
+    count bright pixels. Relative paths are resolved against the JSON file.
+    """
+
+    def __init__(self, config: dict, base_dir: str = "."):
+        """
+        Args:
+            config (dict): Parsed scenario, as described above.
+            base_dir (str): Directory relative file paths are resolved against.
+        """
+        self.config = config
+        self.base_dir = base_dir
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as file:
+            config = json.load(file)
+        return cls(config, os.path.dirname(os.path.abspath(path)))
+
+    def _path(self, path):
+        return os.path.join(self.base_dir, path)
+
+    def build_ground_map(self, **kwargs) -> GroundMap:
+        """GroundMap of the scenario; kwargs are passed on to GroundMap."""
+        settings = self.config.get("map", {})
+        wind_direction = settings.get("wind_direction", [0.0, 0.0])
+        wind_strength = settings.get("wind_strength", 0)
+        kwargs.setdefault("cell_size", settings.get("cell_size"))
+        kwargs.setdefault("chunked", settings.get("chunked", False))
+        for name in ("cluster_method", "n_clusters"):
+            if name in settings:
+                kwargs.setdefault(name, settings[name])
+
+        if "aoi_mask" in self.config:
+            mask = self.load_mask(self._path(self.config["aoi_mask"]))
+            return GroundMap.from_mask(mask, wind_direction, wind_strength, **kwargs)
+
+        return GroundMap(
+            AoI=self.config.get("aoi", []),
+            width=settings["width"],
+            height=settings["height"],
+            wind_direction=wind_direction,
+            wind_strength=wind_strength,
+            **kwargs,
+        )
+
+    @staticmethod
+    def load_mask(path):
+        """(width, height) AoI mask, indexed [x, y], from a .npy or image file."""
+        if path.endswith(".npy"):
+            # (height, width) on disk; the transpose is a view of the map
+            return np.load(path, mmap_mode="r").T
+
+        import pygame
+
+        # surfarray is already indexed [x, y]; array3d converts any bit depth,
+        # so 8-bit grayscale and palette masks load too
+        pixels = pygame.surfarray.array3d(pygame.image.load(path))
+        return pixels.max(axis=2) > 127
+
+    def fleet_rows(self) -> list[dict]:
+        """The fleet table, read from its CSV file if it has one."""
+        rows = self.config.get("fleet", [])
+        if isinstance(rows, str):
+            with open(self._path(rows), newline="") as file:
+                rows = list(csv.DictReader(file))
+        return rows
+
+    def build_fleet(self) -> list[Uav]:
+        fleet = []
+        for row in self.fleet_rows():
+            values = {name: _number(row[name]) for name in FLEET_COLUMNS if name in row}
+            pos = [float(values.pop("x")), float(values.pop("y"))]
+            fleet.append(Uav(pos=pos, **values))
+        return fleet
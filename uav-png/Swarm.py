@@ -1,18 +1,110 @@
+from .Cell import Cell
 from .Uav import Uav
-from .Cell import CellState
 from .GroundMap import GroundMap
 import numpy as np
+from sklearn.neighbors import KDTree
+
+# Above this many (UAV, cell) pairs, nearest cells come from a KD-tree
+BRUTE_FORCE_PAIRS = 1 << 16
+# Nearest cells first fetched per UAV on the KD-tree path; doubled for the
+# UAVs still unserved on every further round
+NEAREST_CANDIDATES = 8
+
+
+def _nearest_pairs(points, candidates, k):
+    """
+    (point, candidate, distance) arrays of each point's k nearest
+    candidates, and whether that is every pair.
+    """
+    n, m = len(points), len(candidates)
+    if n * m <= BRUTE_FORCE_PAIRS or k >= m:
+        distances = np.linalg.norm(points[:, None, :] - candidates[None, :, :], axis=2)
+        pair_points, pair_candidates = np.indices((n, m)).reshape(2, -1)
+        return pair_points, pair_candidates, distances.ravel(), True
+    distances, nearest = KDTree(candidates).query(points, k=k)
+    return np.repeat(np.arange(n), k), nearest.ravel(), distances.ravel(), False
+
+
+def assign_nearest(points, candidates):
+    """
+    Greedily hand each point a distinct candidate, closest pairs first.
+
+    Small sets compare every pair directly. Larger ones fetch only a few
+    nearest candidates per point from a KD-tree and match those; as soon as
+    a point has lost all of its candidates, the matching stops and the
+    points still unserved query again, for more, among the free candidates.
+    The result is the same as matching every pair.
+
+    Args:
+        points (np.ndarray): (n, 2) positions to serve.
+        candidates (np.ndarray): (m, 2) positions to hand out.
+
+    Returns:
+        tuple: (point indices, candidate indices) of the assigned pairs.
+    """
+    if len(candidates) < len(points):
+        # Matching is symmetric; serve the smaller side from the larger one
+        served, chosen = assign_nearest(candidates, points)
+        return chosen, served
+
+    points_left = np.arange(len(points))
+    free = np.arange(len(candidates))
+    assigned_points, assigned_candidates = [], []
+    k = NEAREST_CANDIDATES
+    while len(points_left) and len(free):
+        pair_points, pair_candidates, distances, complete = _nearest_pairs(
+            points[points_left], candidates[free], k
+        )
+        order = np.argsort(distances, kind="stable")
+        k_used = len(pair_points) // len(points_left)
+        point_served = [False] * len(points_left)
+        candidate_taken = [False] * len(free)
+        unseen = [k_used] * len(points_left)
+        to_serve = min(len(points_left), len(free))
+        for point, candidate in zip(
+            pair_points[order].tolist(), pair_candidates[order].tolist()
+        ):
+            if point_served[point]:
+                continue
+            if not candidate_taken[candidate]:
+                point_served[point] = candidate_taken[candidate] = True
+                assigned_points.append(points_left[point])
+                assigned_candidates.append(free[candidate])
+                to_serve -= 1
+                if to_serve == 0:
+                    break
+                continue
+            unseen[point] -= 1
+            if unseen[point] == 0 and not complete:
+                # Its next candidate is unknown; later pairs could take it
+                break
+        points_left = points_left[~np.array(point_served)]
+        free = free[~np.array(candidate_taken)]
+        k *= 2
+    return (
+        np.array(assigned_points, dtype=np.int64),
+        np.array(assigned_candidates, dtype=np.int64),
+    )
 
 
 class Swarm:
-    def __init__(self, uavs: list[Uav], centroid: [float, float]):
+    # Waypoints checked per lookup when skipping cells that are done
+    WAYPOINT_LOOKAHEAD = 64
+
+    def __init__(self, uavs: list[Uav], centroid: [float, float], swarm_id: int = 0):
+        self.id = swarm_id
         self.uavs = uavs
         self.centroid = np.array(centroid)
         self.force_vector = np.array([0.0, 0.0])
         self.radius = None
         self.calculate_radius()
         self.target_cluster = None
+        # Set when the swarm wants a new cluster; SwarmManager assigns one
+        self.needs_target = True
         self.cells_in_swarm = []
+        # Uav -> [waypoints, index of the next one] along the target's path
+        self.routes = {}
+        self._route_plan = None
 
     def is_moving(self):
         return (
@@ -21,71 +113,152 @@ class Swarm:
         )
 
     def update(self):
+        """Advance the centroid and hand out cell targets; UAV motion is
+        stepped for the whole fleet by SwarmManager."""
         self.centroid += self.force_vector
 
+        if not self.is_moving():
+            self.assign_cells()
+
         for uav in self.uavs:
-            if self.is_moving():
-                uav.move(self.centroid, self.uavs)
-            else:
-                if uav.cell_target is None and self.cells_in_swarm:
-                    closest_cell = min(
-                        self.cells_in_swarm,
-                        key=lambda cell: np.linalg.norm(cell.rect.center - uav.pos),
-                    )
-                    uav.set_cell_target(closest_cell)
-
-            uav.move(self.centroid, self.uavs)
             uav.update()
 
+    def plan_routes(self, ground_map: GroundMap):
+        """
+        Split the target cluster's coverage path among the UAVs, each UAV
+        taking the piece that starts nearest to it. Cached until the target
+        or the number of UAVs changes.
+        """
+        plan = (self.target_cluster, len(self.uavs))
+        if self._route_plan == plan:
+            return
+        self._route_plan = plan
+        segments = [
+            segment
+            for segment in self.target_cluster.path_segments(len(self.uavs))
+            if len(segment)
+        ]
+        self.routes = {}
+        if not segments:
+            return
+
+        positions = np.array([uav.pos for uav in self.uavs], dtype=float)
+        firsts = np.array([segment[0] for segment in segments])
+        starts = ground_map.cell_centers(firsts[:, 0], firsts[:, 1])
+        for uav_index, segment_index in zip(*assign_nearest(positions, starts)):
+            self.routes[self.uavs[uav_index]] = [segments[segment_index], 0]
+
+    def has_waypoints(self) -> bool:
+        return any(index < len(path) for path, index in self.routes.values())
+
+    def follow_routes(self, ground_map: GroundMap):
+        """
+        Send every idle UAV to its next waypoint. Waypoints scanned out of
+        order or found unreachable since the plan are skipped here, lazily.
+        """
+        for uav, route in self.routes.items():
+            if uav.cell_target is not None:
+                continue
+            path, index = route
+            while index < len(path):
+                window = path[index : index + self.WAYPOINT_LOOKAHEAD]
+                pending = np.flatnonzero(ground_map.pending[window[:, 0], window[:, 1]])
+                if len(pending):
+                    index += int(pending[0])
+                    x, y = path[index]
+                    uav.set_cell_target(Cell(ground_map, int(x), int(y)))
+                    index += 1
+                    break
+                index += len(window)
+            route[1] = index
+
+    def assign_cells(self):
+        """
+        Give every idle UAV its own pending cell in one batch, nearest pairs
+        first; cells other UAVs of the swarm are flying to are skipped.
+        """
+        idle = [uav for uav in self.uavs if uav.cell_target is None]
+        if not idle or not self.cells_in_swarm:
+            return
+
+        cells = self.cells_in_swarm
+        taken = {
+            (uav.cell_target.x, uav.cell_target.y)
+            for uav in self.uavs
+            if uav.cell_target is not None
+        }
+        if taken:
+            cells = [cell for cell in cells if (cell.x, cell.y) not in taken]
+        if not cells:
+            return
+
+        size = cells[0].ground_map.cell_size
+        centers = np.array([(cell.x, cell.y) for cell in cells]) * size + size // 2
+        positions = np.array([uav.pos for uav in idle], dtype=float)
+        for uav_index, cell_index in zip(*assign_nearest(positions, centers)):
+            idle[uav_index].set_cell_target(cells[cell_index])
+
     def handle_events(self, ground_map: GroundMap):
         if not self.target_cluster:
-            ground_map.update_cluster()
-            self.chose_target(ground_map)
+            self.needs_target = True
             return
 
         self.calculate_force(ground_map)
 
-        is_scan_done = not self.is_moving() and len(self.cells_in_swarm) == 0
+        is_scan_done = (
+            not self.is_moving()
+            and len(self.cells_in_swarm) == 0
+            and not self.has_waypoints()
+        )
         if is_scan_done:
             self.scan_done(ground_map)
             self.is_moving
 
-        self.cells_in_swarm = [
-            cell
-            for cell in ground_map.cells.values()
-            if np.linalg.norm(np.array(cell.rect.center) - self.centroid) <= self.radius
-            and cell.state not in {CellState.SCANNED, CellState.NO_INTEREST}
-        ]
+        self.cells_in_swarm = ground_map.cells_in_radius(self.centroid, self.radius)
 
         for uav in self.uavs:
             uav.handle_events(ground_map)
 
+        if not self.needs_target and not self.is_moving():
+            self.plan_routes(ground_map)
+            self.follow_routes(ground_map)
+
     def scan_done(self, ground_map: GroundMap):
         self.calculate_force(ground_map)
-        ground_map.update_cluster()
-        self.chose_target(ground_map)
+        self.needs_target = True
+
+    def set_target(self, cluster):
+        self.target_cluster = cluster
+        self.needs_target = False
+        self.routes = {}
+        self._route_plan = None
 
     def chose_target(self, ground_map: GroundMap):
+        """Choose the nearest and highest priority cluster for this swarm alone."""
+        ground_map.update_cluster()
         if not ground_map.clusters:
             return
 
-        """Choose the nearest and highest priority cluster."""
-        self.target_cluster = max(
-            ground_map.clusters,
-            key=lambda cluster: cluster.important_score
-            / (max(np.linalg.norm(cluster.centroid - self.centroid), 0.1) ** 2),
-            default=None,
+        self.set_target(
+            max(
+                ground_map.clusters,
+                key=lambda cluster: cluster.remaining
+                / (max(np.linalg.norm(cluster.centroid - self.centroid), 0.1) ** 2),
+            )
         )
 
     def draw(self):
+        self.draw_outline()
+
+        for uav in self.uavs:
+            uav.draw()
+
+    def draw_outline(self):
         from .Game import Game
 
         Game().getWindow().draw_circle(self.centroid, 5, "blue")
         Game().getWindow().draw_circle(self.centroid, self.radius, "blue", 2)
 
-        for uav in self.uavs:
-            uav.draw()
-
     def calculate_force(self, ground_map: GroundMap):
         distance_to_target = np.linalg.norm(
             self.target_cluster.centroid - self.centroid
@@ -105,7 +278,12 @@ class Swarm:
 
     def merge(self, other_swarm):
         """Merge two swarms into one."""
-        self.uavs.extend(other_swarm.uavs)
+        self.merge_all([other_swarm])
+
+    def merge_all(self, other_swarms):
+        """Merge several swarms into this one, recomputing its shape once."""
+        for other_swarm in other_swarms:
+            self.uavs.extend(other_swarm.uavs)
         self.calculate_new_centroid()
         self.calculate_radius()
 
@@ -1,39 +1,156 @@
 from .Swarm import Swarm
+from .Uav import Uav
 from .GroundMap import GroundMap
+from .Kinematics import Kinematics
+from .engine.SpatialGrid import SpatialGrid
+from scipy.optimize import linear_sum_assignment
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+import numpy as np
 
 
 class SwarmManager:
     def __init__(self):
         self.uavs = []
         self.swarms = []
+        self.kinematics = Kinematics()
+        self._next_swarm_id = 0
 
     def add_uav(self, uav):
-        swarm = Swarm([uav], uav.pos)
+        swarm = Swarm([uav], uav.pos, swarm_id=self._next_swarm_id)
+        self._next_swarm_id += 1
         self.swarms.append(swarm)
-        uav.swarm = swarm
+        uav.join_swarm(swarm)
+        uav.attach(self.kinematics)
         self.uavs.append(uav)
 
     def handle_events(self, ground_map: GroundMap):
         for swarm in self.swarms:
             swarm.handle_events(ground_map)
 
+        self._assign_targets(ground_map)
+
+        if self.uavs:
+            ground_map.scan([uav.pos for uav in self.uavs])
+
+    def _assign_targets(self, ground_map: GroundMap):
+        """
+        Give every swarm that needs a target a cluster, jointly: all
+        (swarm, cluster) pairs are scored at once as remaining cells /
+        distance^2 and the total score is maximised with the Hungarian
+        algorithm, so swarms spread over clusters instead of piling onto the
+        same one. Clusters holding cells of another swarm's target are left
+        out; swarms left over once every free cluster is taken go to their
+        best cluster.
+        """
+        waiting = [swarm for swarm in self.swarms if swarm.needs_target]
+        if not waiting:
+            return
+
+        ground_map.update_cluster()
+        # Clusters from an older snapshot may already be fully scanned
+        clusters = [cluster for cluster in ground_map.clusters if cluster.remaining > 0]
+        if not clusters:
+            return
+
+        swarm_centroids = np.array([swarm.centroid for swarm in waiting], dtype=float)
+        cluster_centroids = np.array(
+            [cluster.centroid for cluster in clusters], dtype=float
+        )
+        remaining = np.array([cluster.remaining for cluster in clusters], dtype=float)
+        distances = np.linalg.norm(
+            swarm_centroids[:, None, :] - cluster_centroids[None, :, :], axis=2
+        )
+        scores = remaining[None, :] / np.maximum(distances, 0.1) ** 2
+
+        # Reclustering replaces a cluster as soon as one of its cells is
+        # scanned, so other swarms' targets are matched by the cells they hold
+        taken = set()
+        for swarm in self.swarms:
+            if swarm.needs_target or swarm.target_cluster is None:
+                continue
+            taken.add(id(swarm.target_cluster))
+            taken.update(
+                id(cluster)
+                for cluster in ground_map.clusters_holding(swarm.target_cluster.cells)
+            )
+        free = np.flatnonzero([id(cluster) not in taken for cluster in clusters])
+        choice = scores.argmax(axis=1)
+        if len(free):
+            rows, columns = linear_sum_assignment(scores[:, free], maximize=True)
+            choice[rows] = free[columns]
+
+        for swarm, index in zip(waiting, choice.tolist()):
+            swarm.set_target(clusters[index])
+
     def update(self):
         for swarm in self.swarms:
             swarm.update()
 
-        for i, swarm1 in enumerate(self.swarms):
-            for j, swarm2 in enumerate(self.swarms):
-                if i >= j:
-                    continue
-                if swarm1.is_near(swarm2) and swarm2.is_near(swarm1):
-                    swarm1.merge(swarm2)
-                    self.swarms.remove(swarm2)
-                    for uav in swarm2.uavs:
-                        uav.swarm = swarm1
+        self._move_uavs()
+        self._merge_swarms()
+
+    def _merge_swarms(self):
+        """
+        Merge every group of swarms whose centroids lie within each other's
+        radius. Close pairs come from a spatial grid over the centroids and
+        are batched into groups as the connected components of a sparse
+        graph; each group collapses into its earliest swarm.
+        """
+        if len(self.swarms) < 2:
+            return
+
+        centroids = np.array([swarm.centroid for swarm in self.swarms])
+        radii = np.array([swarm.radius for swarm in self.swarms], dtype=float)
+        grid = SpatialGrid(max(radii.max(), 1e-9))
+        grid.build(centroids)
+        i, j = grid.pairs(radii.max())
+        keep = i < j
+        i, j = i[keep], j[keep]
+        distance = np.linalg.norm(centroids[i] - centroids[j], axis=1)
+        near = distance < np.minimum(radii[i], radii[j])
+        if not near.any():
+            return
+
+        count = len(self.swarms)
+        i, j = i[near], j[near]
+        graph = coo_matrix((np.ones(len(i), dtype=bool), (i, j)), shape=(count, count))
+        _, labels = connected_components(graph, directed=False)
+        # Members of each label in index order, so group[0] is the earliest
+        order = np.argsort(labels, kind="stable")
+        sizes = np.bincount(labels)
+        groups = np.split(order, np.cumsum(sizes)[:-1])
+
+        merged = set()
+        for group in (group.tolist() for group in groups if len(group) > 1):
+            target = self.swarms[group[0]]
+            others = [self.swarms[k] for k in group[1:]]
+            target.merge_all(others)
+            for other in others:
+                for uav in other.uavs:
+                    uav.join_swarm(target)
+            merged.update(group[1:])
+
+        self.swarms = [
+            swarm for k, swarm in enumerate(self.swarms) if k not in merged
+        ]
+
+    def _move_uavs(self):
+        """Step every UAV in one batch; UAVs of a travelling swarm take two
+        unit steps per tick, the others one."""
+        centroids = np.zeros((self._next_swarm_id, 2))
+        steps = np.ones(self._next_swarm_id)
+        for swarm in self.swarms:
+            centroids[swarm.id] = swarm.centroid
+            if swarm.is_moving():
+                steps[swarm.id] = 2
+        self.kinematics.step(centroids, steps)
 
     def draw(self):
         for swarm in self.swarms:
-            swarm.draw()
+            swarm.draw_outline()
+
+        Uav.draw_fleet(self.uavs)
 
     def clean(self):
         for swarm in self.swarms:
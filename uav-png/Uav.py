@@ -1,7 +1,20 @@
 from .engine.TextureManager import TextureManager
-from .Cell import CellState
 from .GroundMap import GroundMap
 import numpy as np
+import pygame
+
+_marker_sprites = {}
+
+
+def _marker_sprite(radius, color, zoom):
+    """Filled circle on a transparent surface, cached per (radius, color, zoom)."""
+    key = (radius, color, zoom)
+    if key not in _marker_sprites:
+        radius = int(radius * zoom)
+        sprite = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        _marker_sprites[key] = sprite
+    return _marker_sprites[key]
 
 
 class Uav:
@@ -15,34 +28,91 @@ class Uav:
         size: float = 30,
         connection_range=10,
     ):
-        self.pos = pos
+        self._kinematics = None
+        self._index = None
+        self._pos = np.array(pos, dtype=float)
+        self._force_vector = np.zeros(2)
+        self._cell_target = None
         self.size = size
         self.remain_energy = remain_energy
         self.min_speed = min_speed
         self.max_speed = max_speed
         self.buffer_data = buffer_data
-        self.force_vector = (0, 0)
         self.connection_radius = connection_range
         self.swarm = None
-        self.cell_target = None
+
+    def attach(self, kinematics):
+        """Move this UAV's motion state into a fleet-wide Kinematics engine."""
+        swarm_id = self.swarm.id if self.swarm is not None else 0
+        self._index = kinematics.add(self._pos, swarm_id)
+        self._kinematics = kinematics
+        self._sync_target()
+
+    def join_swarm(self, swarm):
+        self.swarm = swarm
+        if self._kinematics is not None:
+            self._kinematics.swarm_ids[self._index] = swarm.id
+
+    @property
+    def pos(self):
+        if self._kinematics is not None:
+            return self._kinematics.positions[self._index]
+        return self._pos
+
+    @pos.setter
+    def pos(self, value):
+        if self._kinematics is not None:
+            self._kinematics.positions[self._index] = value
+        else:
+            self._pos = np.array(value, dtype=float)
+
+    @property
+    def force_vector(self):
+        if self._kinematics is not None:
+            return self._kinematics.forces[self._index]
+        return self._force_vector
+
+    @force_vector.setter
+    def force_vector(self, value):
+        if self._kinematics is not None:
+            self._kinematics.forces[self._index] = value
+        else:
+            self._force_vector = np.array(value, dtype=float)
+
+    @property
+    def cell_target(self):
+        return self._cell_target
+
+    @cell_target.setter
+    def cell_target(self, cell):
+        self._cell_target = cell
+        self._sync_target()
+
+    def _sync_target(self):
+        if self._kinematics is not None:
+            target = None if self._cell_target is None else self._cell_target.rect.center
+            self._kinematics.set_target(self._index, target)
 
     def set_cell_target(self, cell):
         self.cell_target = cell
 
     def scan(self, ground_map: GroundMap):
-        for cell in ground_map.cells.values():
-            if cell.state == CellState.NOT_SCANNED:
-                if cell.rect.collidepoint(self.pos):
-                    cell.state = CellState.SCANNED
-                    cell.update_value(0)
+        ground_map.scan([self.pos])
 
     def update(self):
         pass
 
     def handle_events(self, ground_map: GroundMap):
-        if self.cell_target != None and self.cell_target.rect.collidepoint(self.pos):
+        """
+        Drop the cell target once reached, or once it no longer needs a
+        visit (e.g. it became unreachable); scanning is batched by
+        SwarmManager.
+        """
+        if self.cell_target != None and (
+            self.cell_target.rect.collidepoint(self.pos)
+            or not ground_map.pending[self.cell_target.x, self.cell_target.y]
+        ):
             self.cell_target = None
-        self.scan(ground_map)
 
     def draw(self):
         from .Game import Game
@@ -56,25 +126,31 @@ class Uav:
 
         Game().getWindow().draw_circle(self.pos, 3, "green")
 
-    def calculate_force(self, target_pos: [float, float], uavs):
-        force_vector = np.array(target_pos) - self.pos
+    @staticmethod
+    def draw_fleet(uavs):
+        """Draw many UAVs with every sprite and marker in one blits call."""
+        from .Game import Game
 
+        window = Game().getWindow()
+        zoom = window.zoom_factor
+        marker = _marker_sprite(3, "green", zoom)
+        offset = marker.get_width() // 2
+        blits = []
         for uav in uavs:
-            if uav != self and np.linalg.norm(uav.pos - self.pos) < 50:
-                force_vector += self.pos - uav.pos
-
-        force_magnitude = (force_vector[0] ** 2 + force_vector[1] ** 2) ** 0.5
-        if force_magnitude > 0:
-            force_vector /= force_magnitude
-        self.force_vector = force_vector
-
-    def move(self, target_pos: [float, float], uavs):
-        if self.cell_target:
-            self.calculate_force(self.cell_target.rect.center, uavs)
-        else:
-            self.calculate_force(target_pos, uavs)
-
-        self.pos += self.force_vector
+            texture = TextureManager().get_transformed(
+                "uav", (uav.size, uav.size), 0, zoom
+            )
+            if texture is not None:
+                blits.append(
+                    (
+                        texture,
+                        (uav.pos[0] - uav.size // 2, uav.pos[1] - uav.size // 2),
+                    )
+                )
+        for uav in uavs:
+            center = (uav.pos * zoom).astype(int)
+            blits.append((marker, (center[0] - offset, center[1] - offset)))
+        window.blits(blits)
 
     def clean(self):
         pass
@@ -1,12 +1,192 @@
+import argparse
+import os
 from .Game import Game
 
 
-def main():
-    game = Game()
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="uav-png")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="run the demo mission without a window or frame cap",
+    )
+    parser.add_argument(
+        "--max-ticks",
+        type=int,
+        default=100_000,
+        help="stop a headless mission after this many ticks",
+    )
+    parser.add_argument(
+        "--dirty-rects",
+        action="store_true",
+        help="only push changed screen regions to the display",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="write per-phase frame timings to a .csv or .json file on exit",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="run the scaling benchmarks under SDL's dummy video driver",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="benchmark up to 2000x2000 maps and 10k UAVs (slow)",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="PATH",
+        default="benchmark.json",
+        help="where to write the benchmark report",
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="PATH",
+        help="benchmark report to compare against",
+    )
+    parser.add_argument(
+        "--warp",
+        type=float,
+        default=1.0,
+        help="initial time warp (simulated seconds per real second)",
+    )
+    parser.add_argument(
+        "--scenario",
+        metavar="PATH",
+        help="scenario JSON to fly instead of the bundled demo",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        help="record the demo mission to a binary file for --replay",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="play back a mission recorded with --record",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="SPEC",
+        help="run a parameter sweep (JSON spec) across a process pool",
+    )
+    parser.add_argument(
+        "--results",
+        metavar="PATH",
+        default="results.csv",
+        help="where to write the batch results table",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="batch worker processes (defaults to every core)",
+    )
+    return parser.parse_args(argv)
+
+
+def run_headless(
+    max_ticks: int = 100_000,
+    profile_path: str = None,
+    record_path: str = None,
+    scenario_path: str = None,
+):
+    from .DemoState import DemoState
+    from .HeadlessRunner import HeadlessRunner
+    from .engine.Profiler import Profiler
+
+    runner = HeadlessRunner(
+        state_factory=lambda: DemoState(
+            record_path=record_path, scenario_path=scenario_path
+        ),
+        max_ticks=max_ticks,
+    )
+    result = runner.run()
+    print(HeadlessRunner.format_report(result))
+    if profile_path:
+        Profiler().dump(profile_path)
+    return result
+
+
+def run_benchmark(full=False, report_path="benchmark.json", baseline_path=None):
+    import json
+    from .Benchmark import Benchmark, FULL_SWEEP, QUICK_SWEEP
+
+    benchmark = Benchmark(FULL_SWEEP if full else QUICK_SWEEP)
+    report = benchmark.run()
+    Benchmark.save(report, report_path)
+    print(f"report written to {report_path}")
+    if baseline_path:
+        with open(baseline_path) as file:
+            baseline = json.load(file)
+        regressions = Benchmark.compare(report, baseline)
+        for name, params, ratio in regressions:
+            print(f"REGRESSION {name} {params}: {ratio:.2f}x baseline")
+        return not regressions
+    return True
+
+
+def run_batch(
+    spec_path,
+    results_path="results.csv",
+    workers: int = None,
+    scenario_path: str = None,
+    max_ticks: int = 100_000,
+):
+    from .BatchRunner import BatchRunner
+    from .Scenario import Scenario
+
+    runner = BatchRunner(
+        BatchRunner.load_spec(spec_path),
+        scenario=Scenario.load(scenario_path) if scenario_path else None,
+        workers=workers,
+        max_ticks=max_ticks,
+    )
+    results = runner.run()
+    BatchRunner.save(results, results_path)
+    print(f"{len(results)} missions written to {results_path}")
+    return results
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.batch or args.benchmark or args.headless:
+        # None of these show a window; batch workers inherit the driver
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    if args.batch:
+        run_batch(
+            args.batch,
+            args.results,
+            args.workers,
+            args.scenario,
+            args.max_ticks,
+        )
+        return
+    if args.benchmark:
+        if not run_benchmark(args.full, args.report, args.baseline):
+            raise SystemExit(1)
+        return
+
+    if args.headless:
+        run_headless(args.max_ticks, args.profile, args.record, args.scenario)
+        return
+
+    game = Game(
+        dirty_rects=args.dirty_rects,
+        profile_path=args.profile,
+        time_warp=args.warp,
+        record_path=args.record,
+        scenario_path=args.scenario,
+    )
+    if args.replay:
+        from .ReplayState import ReplayState
+        from .engine.GameStateManager import GameStateManager
+
+        GameStateManager().push_state(ReplayState(args.replay))
     while game.isRunning:
-        game.update()
-        game.handle_event()
-        game.render()
+        game.tick()
 
     game.clean()
 
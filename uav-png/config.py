@@ -3,3 +3,4 @@ import os
 MODULE_DIR = os.path.dirname(__file__)
 ASSETS_DIR = os.path.join(MODULE_DIR, "assets")
 IMAGE_DIR = os.path.join(ASSETS_DIR, "images")
+SCENARIO_DIR = os.path.join(ASSETS_DIR, "scenarios")
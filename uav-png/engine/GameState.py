@@ -3,6 +3,10 @@ from abc import ABC, abstractmethod
 
 # Abstract class for a game state
 class GameState(ABC):
+    def handle_input(self):
+        """Handle keyboard and mouse input, once per rendered frame."""
+        pass
+
     @abstractmethod
     def handle_events(self):
         """Handle user input."""
@@ -1,5 +1,6 @@
 from collections import deque
 from .Singleton import Singleton
+from .Profiler import Profiler
 
 
 @Singleton
@@ -22,23 +23,32 @@ class GameStateManager:
             self.states.pop()
         self.states.append(state)
 
+    def handle_input(self):
+        """Forward this frame's input to the current state."""
+        if self.states:
+            current_state = self.states[-1]  # Store the reference
+            current_state.handle_input()
+
     def handle_events(self):
         """Forward events to the current state."""
         if self.states:
             current_state = self.states[-1]  # Store the reference
-            current_state.handle_events()
+            with Profiler().section(f"{type(current_state).__name__}.events"):
+                current_state.handle_events()
 
     def update(self):
         """Update the current state."""
         if self.states:
             current_state = self.states[-1]  # Store the reference
-            current_state.update()
+            with Profiler().section(f"{type(current_state).__name__}.update"):
+                current_state.update()
 
     def render(self):
         """Render the current state."""
         if self.states:
             current_state = self.states[-1]  # Store the reference
-            current_state.render()
+            with Profiler().section(f"{type(current_state).__name__}.render"):
+                current_state.render()
 
     def clean(self):
         """Clean up the current state."""
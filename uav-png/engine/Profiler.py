@@ -0,0 +1,117 @@
+import csv
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from .Singleton import Singleton
+
+
+@Singleton
+class Profiler:
+    def __init__(self, history=600):
+        """
+        Per-section frame timings kept in fixed-size ring buffers.
+
+        Args:
+            history (int): Number of samples kept per section.
+        """
+        self.history = history
+        self.samples = {}  # Section name -> deque of durations in seconds
+        self.enabled = True
+        self.overlay_visible = False
+
+    @contextmanager
+    def section(self, name):
+        """Time the body of a with-block under the given section name."""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name, seconds):
+        """Append one duration to a section's ring buffer."""
+        if name not in self.samples:
+            self.samples[name] = deque(maxlen=self.history)
+        self.samples[name].append(seconds)
+
+    def stats(self):
+        """
+        Summary of every section, in milliseconds.
+
+        Returns:
+            dict: name -> {"last", "mean", "max", "count"}.
+        """
+        result = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            result[name] = {
+                "last": samples[-1] * 1000,
+                "mean": sum(samples) / len(samples) * 1000,
+                "max": max(samples) * 1000,
+                "count": len(samples),
+            }
+        return result
+
+    def toggle_overlay(self):
+        self.overlay_visible = not self.overlay_visible
+
+    def draw_overlay(self, window, font_size=18):
+        """Draw a table of section timings in the top-left corner."""
+        if not self.overlay_visible:
+            return
+
+        from pygame import Rect
+        from .TextManager import TextManager
+
+        lines = ["section            last    mean     max (ms)"]
+        for name, stat in sorted(self.stats().items()):
+            lines.append(
+                f"{name:<16} {stat['last']:7.2f} {stat['mean']:7.2f} {stat['max']:7.2f}"
+            )
+
+        rendered = [
+            TextManager().render(line, None, font_size, "black") for line in lines
+        ]
+        width = max(surface.get_width() for surface in rendered) + 20
+        height = sum(surface.get_height() for surface in rendered) + 20
+        window.screen.fill("white", Rect(0, 0, width, height))
+        window.mark_dirty(Rect(0, 0, width, height))
+        y = 10
+        for surface in rendered:
+            window.blit(surface, (10, y))
+            y += surface.get_height()
+
+    def dump(self, path):
+        """
+        Write every recorded sample to a .csv (section, index, ms) or .json
+        (summary plus samples) file, chosen by the path's extension.
+        """
+        if str(path).endswith(".csv"):
+            with open(path, "w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["section", "index", "ms"])
+                for name, samples in self.samples.items():
+                    for index, seconds in enumerate(samples):
+                        writer.writerow([name, index, f"{seconds * 1000:.4f}"])
+        else:
+            with open(path, "w") as file:
+                json.dump(
+                    {
+                        "stats": self.stats(),
+                        "samples_ms": {
+                            name: [seconds * 1000 for seconds in samples]
+                            for name, samples in self.samples.items()
+                        },
+                    },
+                    file,
+                    indent=2,
+                )
+
+    def clear(self):
+        self.samples.clear()
@@ -0,0 +1,87 @@
+import numpy as np
+
+
+class SpatialGrid:
+    """Uniform-grid cell list over 2D points for fixed-radius neighbour search."""
+
+    def __init__(self, cell_size: float):
+        """
+        Args:
+            cell_size (float): Bucket edge length; queries must use radius <= cell_size.
+        """
+        self.cell_size = cell_size
+        self.positions = np.zeros((0, 2))
+        self.order = np.zeros(0, dtype=np.int64)
+        self.sorted_keys = np.zeros(0, dtype=np.int64)
+        self._keys = np.zeros(0, dtype=np.int64)
+        self._origin = np.zeros(2, dtype=np.int64)
+        self._span = 1
+
+    def _buckets(self, positions):
+        return np.floor(np.asarray(positions) / self.cell_size).astype(np.int64)
+
+    def _key(self, buckets):
+        # One empty bucket of padding on every side keeps the +-1 neighbours
+        # of every occupied bucket on distinct keys
+        shifted = buckets - self._origin + 1
+        return shifted[..., 0] * self._span + shifted[..., 1]
+
+    def build(self, positions):
+        """Rebuild the buckets from scratch for an (n, 2) array of points."""
+        self.positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        if len(self.positions) == 0:
+            self.order = np.zeros(0, dtype=np.int64)
+            self.sorted_keys = np.zeros(0, dtype=np.int64)
+            self._keys = np.zeros(0, dtype=np.int64)
+            return
+
+        buckets = self._buckets(self.positions)
+        self._origin = buckets.min(axis=0)
+        self._span = int(buckets[:, 1].max() - self._origin[1]) + 3
+        self._keys = self._key(buckets)
+        self.order = np.argsort(self._keys, kind="stable")
+        self.sorted_keys = self._keys[self.order]
+
+    def _candidates(self, keys):
+        """(query, point) index pairs for points in the 3x3 buckets around keys."""
+        queries, points = [], []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                neighbour = keys + dx * self._span + dy
+                start = np.searchsorted(self.sorted_keys, neighbour, side="left")
+                stop = np.searchsorted(self.sorted_keys, neighbour, side="right")
+                counts = stop - start
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+                query = np.repeat(np.arange(len(keys)), counts)
+                first = np.repeat(start - (np.cumsum(counts) - counts), counts)
+                queries.append(query)
+                points.append(self.order[first + np.arange(total)])
+
+        if not queries:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        return np.concatenate(queries), np.concatenate(points)
+
+    def pairs(self, radius: float):
+        """
+        Every ordered pair (i, j), i != j, of built points closer than radius.
+
+        Returns:
+            tuple: (i, j) index arrays.
+        """
+        i, j = self._candidates(self._keys)
+        diff = self.positions[i] - self.positions[j]
+        near = (i != j) & (diff[:, 0] ** 2 + diff[:, 1] ** 2 < radius * radius)
+        return i[near], j[near]
+
+    def query(self, point, radius: float):
+        """Indices of built points closer than radius to point."""
+        if len(self.positions) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        point = np.asarray(point, dtype=float).reshape(1, 2)
+        _, j = self._candidates(self._key(self._buckets(point)))
+        diff = self.positions[j] - point
+        return j[diff[:, 0] ** 2 + diff[:, 1] ** 2 < radius * radius]
@@ -1,13 +1,19 @@
 import pygame
+from collections import OrderedDict
 from .Singleton import Singleton
 from .Window import Window
 
 
 @Singleton
 class TextManager:
-    def __init__(self):
+    def __init__(self, max_rendered=1024):
         pygame.font.init()
         self.font_cache = {}
+        # LRU of rendered text surfaces
+        self.rendered_cache = OrderedDict()
+        self.max_rendered = max_rendered
+        self.hits = 0
+        self.misses = 0
 
     def get_font(self, font_path, font_size):
         """Retrieve a cached font or create a new one."""
@@ -16,6 +22,33 @@ class TextManager:
             self.font_cache[font_key] = pygame.font.Font(font_path, font_size)
         return self.font_cache[font_key]
 
+    def render(self, text, font_path, font_size, color, zoom=1.0):
+        """
+        Rendered surface for a line of text, served from the LRU cache.
+
+        Args:
+            font_size (int): Final (already zoom scaled) font size.
+            zoom (float): Zoom factor the size was scaled by, part of the key.
+        """
+        key = (text, font_path, font_size, tuple(pygame.Color(color)), zoom)
+        surface = self.rendered_cache.get(key)
+        if surface is not None:
+            self.rendered_cache.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(font_path, font_size).render(text, True, color)
+        self.rendered_cache[key] = surface
+        if len(self.rendered_cache) > self.max_rendered:
+            self.rendered_cache.popitem(last=False)
+        return surface
+
+    def clear_rendered(self):
+        self.rendered_cache.clear()
+        self.hits = 0
+        self.misses = 0
+
     def print(
         self,
         window: Window,
@@ -25,6 +58,7 @@ class TextManager:
         font_size=24,
         color=(255, 255, 255),
         max_width=None,
+        surface=None,
     ):
         """
         Draw text on the screen, with optional line wrapping.
@@ -35,6 +69,7 @@ class TextManager:
             font_size (int): Font size for the text.
             color (tuple): Text color as an (R, G, B) tuple.
             max_width (int): Maximum width for text wrapping (optional).
+            surface (pygame.Surface): Draw here instead of the window (optional).
         """
         try:
             # Scale font size based on zoom factor
@@ -48,8 +83,8 @@ class TextManager:
                 current_line = []
                 for word in words:
                     current_line.append(word)
-                    rendered_line = font.render(" ".join(current_line), True, color)
-                    if rendered_line.get_width() > max_width:
+                    line_width, _ = font.size(" ".join(current_line))
+                    if line_width > max_width:
                         current_line.pop()
                         lines.append(" ".join(current_line))
                         current_line = [word]
@@ -59,16 +94,22 @@ class TextManager:
                 lines = [text]
 
             # Pre-render all lines
-            rendered_lines = [font.render(line, True, color) for line in lines]
+            rendered_lines = [
+                self.render(line, font_path, font_size, color, window.zoom_factor)
+                for line in lines
+            ]
 
             # Draw each line with adjusted position based on zoom
+            target = window.screen if surface is None else surface
             y_offset = 0
             total_text_height = sum(line.get_height() for line in rendered_lines)
             for rendered_line in rendered_lines:
                 text_width, text_height = rendered_line.get_size()
                 x = position[0] - text_width // 2
                 y = position[1] + y_offset - (total_text_height) // 2
-                window.screen.blit(rendered_line, (x, y))
+                drawn = target.blit(rendered_line, (x, y))
+                if surface is None:
+                    window.mark_dirty(drawn)
                 y_offset += text_height
         except Exception as e:
             print(f"Error drawing font: {e}")
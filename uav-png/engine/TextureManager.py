@@ -1,13 +1,17 @@
 import pygame
+from collections import OrderedDict
 from .Singleton import Singleton
 from .Window import Window
 
 
 @Singleton
 class TextureManager:
-    def __init__(self):
+    def __init__(self, max_transformed=256):
         """Initialize the texture manager."""
         self.textures = {}  # Dictionary to hold loaded textures
+        # LRU of scaled/rotated copies keyed by (name, size, rotation, zoom)
+        self.transformed_cache = OrderedDict()
+        self.max_transformed = max_transformed
 
     def load_texture(self, name, file_path, colorkey=None, scale=None):
         """
@@ -46,6 +50,36 @@ class TextureManager:
         """
         return self.textures.get(name, None)
 
+    def get_transformed(self, name, scale=None, rotation=0, zoom=1.0):
+        """
+        Get a texture scaled to scale * zoom and rotated, from the LRU cache.
+
+        Returns:
+            pygame.Surface: The transformed texture, or None if not found.
+        """
+        key = (name, None if scale is None else tuple(scale), rotation, zoom)
+        texture = self.transformed_cache.get(key)
+        if texture is not None:
+            self.transformed_cache.move_to_end(key)
+            return texture
+
+        texture = self.get_texture(name)
+        if texture is None:
+            return None
+
+        if scale is None:
+            scale = texture.get_size()
+        size = (int(scale[0] * zoom), int(scale[1] * zoom))
+        if size != texture.get_size():
+            texture = pygame.transform.scale(texture, size)
+        if rotation != 0:
+            texture = pygame.transform.rotate(texture, rotation)
+
+        self.transformed_cache[key] = texture
+        if len(self.transformed_cache) > self.max_transformed:
+            self.transformed_cache.popitem(last=False)
+        return texture
+
     def draw_texture(self, window: Window, name, position, rotation=0, scale=None):
         """
         Draw a texture to the screen.
@@ -57,26 +91,29 @@ class TextureManager:
             rotation (float): Degrees to rotate the texture (optional).
             scale (tuple): New size to scale the texture to, as (width, height) (optional).
         """
-        texture = self.get_texture(name)
+        texture = self.get_transformed(name, scale, rotation, window.zoom_factor)
         if texture is None:
             print(f"Texture '{name}' not found!")
             return
 
-        # Apply rotation and scaling if needed
-        if rotation != 0 or scale is not None:
-            texture = texture.copy()  # Avoid modifying the original
-            if scale is not None:
-                scale = (
-                    int(scale[0] * window.zoom_factor),
-                    int(scale[1] * window.zoom_factor),
-                )
-                texture = pygame.transform.scale(texture, scale)
-            if rotation != 0:
-                texture = pygame.transform.rotate(texture, rotation)
+        window.blit(texture, position)
+
+    def draw_textures(self, window: Window, name, positions, rotation=0, scale=None):
+        """
+        Draw one texture at many positions with a single blits call.
+
+        Args:
+            name (str): Name of the texture to draw.
+            positions (iterable): (x, y) top-left position of every copy.
+            rotation (float): Degrees to rotate the texture (optional).
+            scale (tuple): New size to scale the texture to, as (width, height) (optional).
+        """
+        texture = self.get_transformed(name, scale, rotation, window.zoom_factor)
+        if texture is None:
+            print(f"Texture '{name}' not found!")
+            return
 
-        # Draw the texture with adjusted position based on zoom
-        rect = texture.get_rect(topleft=position)
-        window.draw_image(texture, rect)
+        window.blits([(texture, position) for position in positions])
 
     def unload_texture(self, name):
         """
@@ -87,9 +124,12 @@ class TextureManager:
         """
         if name in self.textures:
             del self.textures[name]
+            for key in [key for key in self.transformed_cache if key[0] == name]:
+                del self.transformed_cache[key]
         else:
             print(f"Texture '{name}' not found!")
 
     def clear_textures(self):
         """Clear all loaded textures."""
         self.textures.clear()
+        self.transformed_cache.clear()
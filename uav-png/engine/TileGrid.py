@@ -0,0 +1,280 @@
+import numpy as np
+
+
+class TileGrid:
+    """
+    Sparse 2D array split into square tiles that are only allocated once a
+    value other than the fill value is written to them. Reads of missing
+    tiles return the fill value.
+
+    Supports the subset of numpy indexing the maps use: integer (fancy)
+    indexing with broadcasting, contiguous slices (which read as dense
+    copies), element-wise comparisons with a scalar, nonzero(), sum() and
+    any().
+    """
+
+    def __init__(self, shape, dtype, fill=0, tile_size: int = 64):
+        """
+        Args:
+            shape ((int, int)): Logical (width, height) of the grid.
+            dtype: numpy dtype of the cells.
+            fill: Value of every cell that was never written.
+            tile_size (int): Edge length of a tile, in cells.
+        """
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.dtype = np.dtype(dtype)
+        self.fill = self.dtype.type(fill)
+        self.tile_size = int(tile_size)
+        self.tiles_y = -(-self.shape[1] // self.tile_size)
+        self.tiles = {}  # (tx, ty) -> (tile_size, tile_size) array
+
+    ndim = 2
+
+    @property
+    def size(self):
+        return self.shape[0] * self.shape[1]
+
+    @property
+    def nbytes(self):
+        """Memory held by the allocated tiles."""
+        return sum(tile.nbytes for tile in self.tiles.values())
+
+    def _new_tile(self):
+        return np.full((self.tile_size, self.tile_size), self.fill, dtype=self.dtype)
+
+    def _indices(self, key):
+        """Broadcast, bounds-checked (xs, ys) arrays for an integer key."""
+        xs, ys = np.broadcast_arrays(np.asarray(key[0]), np.asarray(key[1]))
+        xs = np.where(xs < 0, xs + self.shape[0], xs).astype(np.int64)
+        ys = np.where(ys < 0, ys + self.shape[1], ys).astype(np.int64)
+        if xs.size and (
+            xs.min() < 0
+            or ys.min() < 0
+            or xs.max() >= self.shape[0]
+            or ys.max() >= self.shape[1]
+        ):
+            raise IndexError(f"index out of bounds for TileGrid of shape {self.shape}")
+        return xs, ys
+
+    def _by_tile(self, xs, ys):
+        """Yield (tile key, positions into xs/ys) grouped by tile."""
+        size = self.tile_size
+        keys = (xs // size) * self.tiles_y + ys // size
+        # Stable, so repeated writes to a cell keep numpy's last-wins order
+        order = np.argsort(keys, kind="stable")
+        unique, starts = np.unique(keys[order], return_index=True)
+        stops = np.append(starts[1:], len(order))
+        for key, start, stop in zip(unique.tolist(), starts, stops):
+            yield divmod(key, self.tiles_y), order[start:stop]
+
+    def _region(self, key):
+        """(x0, x1, y0, y1) of a slice key, or None for integer keys."""
+        if key is Ellipsis or isinstance(key, slice):
+            key = (key if isinstance(key, slice) else slice(None), slice(None))
+        if not all(isinstance(part, slice) for part in key):
+            if any(isinstance(part, slice) for part in key):
+                raise IndexError("TileGrid can't mix slices and integer indices")
+            return None
+        bounds = []
+        for part, dim in zip(key, self.shape):
+            start, stop, step = part.indices(dim)
+            if step != 1:
+                raise IndexError("TileGrid slices must have a step of 1")
+            bounds.extend((start, max(stop, start)))
+        return tuple(bounds)
+
+    def _tiles_in(self, x0, x1, y0, y1, allocated_only=True):
+        """Yield (tx, ty) of the tiles overlapping a region."""
+        size = self.tile_size
+        tx0, tx1 = x0 // size, -(-x1 // size)
+        ty0, ty1 = y0 // size, -(-y1 // size)
+        if allocated_only and len(self.tiles) < (tx1 - tx0) * (ty1 - ty0):
+            for tx, ty in list(self.tiles):
+                if tx0 <= tx < tx1 and ty0 <= ty < ty1:
+                    yield tx, ty
+            return
+        for tx in range(tx0, tx1):
+            for ty in range(ty0, ty1):
+                if not allocated_only or (tx, ty) in self.tiles:
+                    yield tx, ty
+
+    def _overlap(self, tx, ty, x0, x1, y0, y1):
+        """Slices into the region and into the tile where they overlap."""
+        size = self.tile_size
+        left, top = tx * size, ty * size
+        ax0, ax1 = max(x0, left), min(x1, left + size)
+        ay0, ay1 = max(y0, top), min(y1, top + size)
+        return (
+            (slice(ax0 - x0, ax1 - x0), slice(ay0 - y0, ay1 - y0)),
+            (slice(ax0 - left, ax1 - left), slice(ay0 - top, ay1 - top)),
+        )
+
+    def __getitem__(self, key):
+        region = self._region(key)
+        if region is not None:
+            x0, x1, y0, y1 = region
+            out = np.full((x1 - x0, y1 - y0), self.fill, dtype=self.dtype)
+            for tx, ty in self._tiles_in(x0, x1, y0, y1):
+                out_slice, tile_slice = self._overlap(tx, ty, x0, x1, y0, y1)
+                out[out_slice] = self.tiles[(tx, ty)][tile_slice]
+            return out
+
+        xs, ys = self._indices(key)
+        out = np.full(xs.shape, self.fill, dtype=self.dtype)
+        if self.tiles and xs.size:
+            flat_x, flat_y = xs.ravel(), ys.ravel()
+            flat_out = out.reshape(-1)
+            size = self.tile_size
+            for tile_key, where in self._by_tile(flat_x, flat_y):
+                tile = self.tiles.get(tile_key)
+                if tile is not None:
+                    flat_out[where] = tile[flat_x[where] % size, flat_y[where] % size]
+        return out[()] if out.ndim == 0 else out
+
+    def __setitem__(self, key, value):
+        region = self._region(key)
+        if region is not None:
+            self._set_region(region, value)
+            return
+
+        xs, ys = self._indices(key)
+        values = np.broadcast_to(np.asarray(value, dtype=self.dtype), xs.shape).ravel()
+        flat_x, flat_y = xs.ravel(), ys.ravel()
+        size = self.tile_size
+        for tile_key, where in self._by_tile(flat_x, flat_y):
+            tile = self.tiles.get(tile_key)
+            if tile is None:
+                if np.all(values[where] == self.fill):
+                    continue
+                tile = self.tiles[tile_key] = self._new_tile()
+            tile[flat_x[where] % size, flat_y[where] % size] = values[where]
+
+    def _set_region(self, region, value):
+        x0, x1, y0, y1 = region
+        value = np.asarray(value, dtype=self.dtype)
+        if value.ndim == 0:
+            if value == self.fill:
+                # Writing the fill value: drop covered tiles, clear the rest
+                for tx, ty in self._tiles_in(x0, x1, y0, y1):
+                    if self._covers(tx, ty, x0, x1, y0, y1):
+                        del self.tiles[(tx, ty)]
+                    else:
+                        _, tile_slice = self._overlap(tx, ty, x0, x1, y0, y1)
+                        self.tiles[(tx, ty)][tile_slice] = self.fill
+                return
+
+        value = np.broadcast_to(value, (x1 - x0, y1 - y0))
+        for tx, ty in self._tiles_in(x0, x1, y0, y1, allocated_only=False):
+            out_slice, tile_slice = self._overlap(tx, ty, x0, x1, y0, y1)
+            part = value[out_slice]
+            tile = self.tiles.get((tx, ty))
+            if tile is None:
+                if np.all(part == self.fill):
+                    continue
+                tile = self.tiles[(tx, ty)] = self._new_tile()
+            tile[tile_slice] = part
+
+    def _covers(self, tx, ty, x0, x1, y0, y1):
+        """Whether the region covers every in-bounds cell of a tile."""
+        size = self.tile_size
+        return (
+            x0 <= tx * size
+            and y0 <= ty * size
+            and x1 >= min((tx + 1) * size, self.shape[0])
+            and y1 >= min((ty + 1) * size, self.shape[1])
+        )
+
+    def apply(self, func, dtype=None):
+        """New TileGrid of func applied element-wise to every cell."""
+        fill = np.asarray(func(np.full(1, self.fill, dtype=self.dtype)))[0]
+        result = TileGrid(
+            self.shape, dtype or fill.dtype, fill=fill, tile_size=self.tile_size
+        )
+        for key, tile in self.tiles.items():
+            result.tiles[key] = np.asarray(func(tile), dtype=result.dtype)
+        return result
+
+    def __eq__(self, other):
+        return self.apply(lambda tile: tile == other, bool)
+
+    def __ne__(self, other):
+        return self.apply(lambda tile: tile != other, bool)
+
+    def __lt__(self, other):
+        return self.apply(lambda tile: tile < other, bool)
+
+    def __le__(self, other):
+        return self.apply(lambda tile: tile <= other, bool)
+
+    def __gt__(self, other):
+        return self.apply(lambda tile: tile > other, bool)
+
+    def __ge__(self, other):
+        return self.apply(lambda tile: tile >= other, bool)
+
+    def __invert__(self):
+        return self.apply(np.invert)
+
+    __hash__ = None
+
+    def _in_bounds(self, tx, ty):
+        """In-bounds (width, height) of a tile at the grid's edge."""
+        size = self.tile_size
+        return (
+            min(size, self.shape[0] - tx * size),
+            min(size, self.shape[1] - ty * size),
+        )
+
+    def nonzero(self):
+        """(xs, ys) of every nonzero cell, in the same order as numpy's."""
+        size = self.tile_size
+        tiles = self.tiles
+        if self.fill:
+            # Unwritten cells count too, so every tile position is visited
+            keys = list(self._tiles_in(0, self.shape[0], 0, self.shape[1], False))
+        else:
+            keys = list(tiles)
+        xs, ys = [], []
+        for tx, ty in keys:
+            width, height = self._in_bounds(tx, ty)
+            tile = tiles.get((tx, ty))
+            if tile is None:
+                tile_xs, tile_ys = np.indices((width, height)).reshape(2, -1)
+            else:
+                tile_xs, tile_ys = np.nonzero(tile[:width, :height])
+            xs.append(tile_xs + tx * size)
+            ys.append(tile_ys + ty * size)
+        if not xs:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+        xs, ys = np.concatenate(xs), np.concatenate(ys)
+        order = np.lexsort((ys, xs))
+        return xs[order], ys[order]
+
+    def _cropped_tiles(self):
+        """Allocated tiles, cut to the cells inside the grid."""
+        for (tx, ty), tile in self.tiles.items():
+            width, height = self._in_bounds(tx, ty)
+            yield tile[:width, :height]
+
+    def _unallocated_cells(self):
+        return self.size - sum(tile.size for tile in self._cropped_tiles())
+
+    def sum(self):
+        total = sum(tile.sum(dtype=np.int64) for tile in self._cropped_tiles())
+        return int(total) + int(self.fill) * self._unallocated_cells()
+
+    def any(self):
+        if self.fill and self._unallocated_cells():
+            return True
+        return any(tile.any() for tile in self._cropped_tiles())
+
+    def __array__(self, dtype=None, copy=None):
+        """Dense copy of the whole grid."""
+        dense = self[:, :]
+        return dense if dtype is None else dense.astype(dtype)
+
+    def copy(self):
+        result = TileGrid(self.shape, self.dtype, self.fill, self.tile_size)
+        result.tiles = {key: tile.copy() for key, tile in self.tiles.items()}
+        return result
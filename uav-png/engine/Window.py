@@ -4,15 +4,66 @@ import numpy as np
 
 
 class Window:
-    def __init__(self, width, height, FPS):
+    # Above this many rects a frame is presented with a full flip instead
+    MAX_DIRTY_RECTS = 512
+
+    def __init__(self, width, height, FPS, headless=False, dirty_rects=False):
         self.width = width
         self.height = height
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        self.headless = headless
+        if headless:
+            # Off-screen surface: nothing is ever presented to a display
+            self.screen = pygame.Surface((self.width, self.height))
+        else:
+            self.screen = pygame.display.set_mode((self.width, self.height))
         self.clock = pygame.time.Clock()
         self.FPS = FPS
         self.background_image = None
         self.zoom_factor = 1.0  # Zoom factor (1.0 means no zoom)
 
+        # Dirty-rect mode: only regions drawn this frame or last frame are
+        # pushed to the display
+        self.dirty_rects = dirty_rects
+        self._drawn = []  # Transient content, erased again next frame
+        self._static = []  # Restored background, presented but not erased
+        self._erased = []
+        self._previous_drawn = None  # None until the first full frame
+        self._full_frame = False
+
+    def mark_dirty(self, rect):
+        """Record a screen region drawn this frame."""
+        if self.dirty_rects:
+            self._drawn.append(Rect(rect))
+
+    def begin_frame(self, color):
+        """Clear the screen for a new frame: fully, or in dirty-rect mode only
+        where last frame's content was drawn."""
+        self._drawn, self._static = [], []
+        self._erased = []
+        if not self.dirty_rects or self._previous_drawn is None:
+            self.fill(color)
+            return
+
+        for rect in self._previous_drawn:
+            self.screen.fill(color, rect)
+        self._erased = self._previous_drawn
+
+    def present(self):
+        """Show the frame: update only the dirty rects when possible."""
+        if self.headless:
+            pass
+        elif not self.dirty_rects or self._full_frame:
+            pygame.display.flip()
+        else:
+            rects = self._erased + self._static + self._drawn
+            if len(rects) > self.MAX_DIRTY_RECTS:
+                pygame.display.flip()
+            else:
+                pygame.display.update(rects)
+
+        self._previous_drawn = self._drawn
+        self._full_frame = False
+
     def set_background_image(self, img_path):
         self.background_image = pygame.image.load(img_path)
         self.background_image = pygame.transform.scale(
@@ -28,7 +79,7 @@ class Window:
                     int(self.height * self.zoom_factor),
                 ),
             )
-            self.screen.blit(scaled_background, (0, 0))
+            self.mark_dirty(self.screen.blit(scaled_background, (0, 0)))
 
     def draw_image(self, texture, position, scale=None, rotation=0):
         """
@@ -47,7 +98,46 @@ class Window:
         texture = pygame.transform.scale(texture, scale)
         if rotation != 0:
             texture = pygame.transform.rotate(texture, rotation)
-        self.screen.blit(texture, position)
+        self.mark_dirty(self.screen.blit(texture, position))
+
+    def blit(self, surface, position):
+        """Copy a surface onto the screen as-is, without zoom scaling."""
+        self.mark_dirty(self.screen.blit(surface, position))
+
+    def blit_static(self, surface, position, changed=None):
+        """
+        Copy a mostly unchanging background surface onto the screen.
+
+        In dirty-rect mode only the parts under regions erased this frame and
+        the changed rects are copied, and they are not erased next frame.
+
+        Args:
+            surface (pygame.Surface): The background surface.
+            position (tuple): (x, y) screen position of the surface.
+            changed (list): Rects of the surface that changed (None for all).
+        """
+        if not self.dirty_rects or self._full_frame or changed is None:
+            self._static.append(self.screen.blit(surface, position))
+            return
+
+        bounds = surface.get_rect()
+        areas = [rect.move(-position[0], -position[1]) for rect in self._erased]
+        areas.extend(changed)
+        blits = []
+        for area in areas:
+            area = area.clip(bounds)
+            if area.width and area.height:
+                blits.append(
+                    (surface, (position[0] + area.x, position[1] + area.y), area)
+                )
+        self._static.extend(self.screen.blits(blits))
+
+    def blits(self, sequence):
+        """Copy many (surface, position) pairs onto the screen in one call."""
+        if self.dirty_rects:
+            self._drawn.extend(self.screen.blits(sequence))
+        else:
+            self.screen.blits(sequence, doreturn=False)
 
     def draw_rect(self, color, rect: Rect, radius=0, border=0, border_color="black"):
         """
@@ -68,7 +158,7 @@ class Window:
         )
 
         # Draw the main box
-        pygame.draw.rect(
+        drawn = pygame.draw.rect(
             self.screen,
             color,
             rect,
@@ -84,20 +174,28 @@ class Window:
                 width=int(border * self.zoom_factor),
                 border_radius=int(radius * self.zoom_factor),
             )
+        self.mark_dirty(drawn)
 
     def draw_circle(self, centroid: (float, float), radius, color, width=0):
         """Draw a circle at the zoomed coordinates."""
         centroid = (np.array(centroid) * self.zoom_factor).astype(int)
         radius = int(radius * self.zoom_factor)
-        pygame.draw.circle(self.screen, color, centroid, radius, width=width)
+        self.mark_dirty(
+            pygame.draw.circle(self.screen, color, centroid, radius, width=width)
+        )
 
     def fill(self, color: pygame.Color):
         """Fill the entire screen with the zoomed background color."""
         self.screen.fill(color)
+        self._full_frame = True
 
     def handle_FPS(self):
-        """Handle the frame rate limit."""
-        self.clock.tick(self.FPS)
+        """Handle the frame rate limit (an FPS of 0 runs uncapped).
+
+        Returns:
+            int: Milliseconds since the previous call.
+        """
+        return self.clock.tick(self.FPS)
 
     def getScreen(self):
         """Return the game screen."""